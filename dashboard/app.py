@@ -2,10 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pandas as pd
 import streamlit as st
 
 from dashboard.config import DEFAULT_DATA_BASE_PATH
-from dashboard.data_access.participants import list_participants, participant_path
+from dashboard.data_access.participants import participant_path
 from dashboard.modalities.eeg.processing import summarize_meditation_recordings, summarize_sleep_recordings
 from dashboard.modalities.wristband.processing import summarize_wristband_recordings
 from dashboard.modalities.subjective.processing import summarize_subjective_data
@@ -15,7 +16,7 @@ from dashboard.pages.sleep import render_sleep_tab
 from dashboard.pages.subjective import render_subjective_tab
 from dashboard.pages.wristband import render_wristband_tab
 from dashboard.services.cohort_builder import _build_cohort_table
-from dashboard.services.data_loader import get_sleep_reports, get_wristband_data, get_meditation_data, get_subjective_data
+from dashboard.services.data_loader import get_participants, load_participant_bundle
 from dashboard.services.data_quality import wristband_days_with_following_sleep_night, nights_with_following_wristband_day
 
 # Suppress specific warnings from plotly about nanoseconds in datetime conversion, which can occur with certain timestamp formats in the data but do not affect the overall functionality of the dashboard.
@@ -28,6 +29,11 @@ warnings.filterwarnings(
     module=r"plotly\.io\._json",
 )
 
+# Views derived from the cached frames rely on copy-on-write instead of defensive
+# .copy() calls; pandas >= 3 always behaves this way and deprecates the option.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
 
 def _render_summary(wristband_days: int, wristband_total_hours: float, sleep_nights: int, sleep_hours: float, meditation_sessions: int, meditation_hours: float, 
                     sleep_diary_sheets: int, tet_diary_sheets: int, activity_diary_sheets: int, tet_meditation_sheets: int) -> None:
@@ -67,7 +73,7 @@ def run_dashboard() -> None:
         st.warning(f"⚠️ Data path does not exist: {data_base_path}")
         st.stop()
 
-    participants = list_participants(data_base_path)
+    participants = get_participants(data_base_path)
     if not participants:
         st.error("❌ No participant folders found in the specified path")
         st.stop()
@@ -152,11 +158,8 @@ def run_dashboard() -> None:
                 for pid in selected_for_overview:
                     p_dir = participant_path(data_base_path, pid)
                     with st.spinner(f"Rendering overview for {pid}..."):
-                        df_wristband, wristband_wear_col = get_wristband_data(str(p_dir))
-                        df_sleep = get_sleep_reports(str(p_dir))
-                        df_meditation = get_meditation_data(str(p_dir))
-                        df_subjective = get_subjective_data(str(p_dir))
-                        fig = build_combined_overview(df_wristband, wristband_wear_col, df_sleep, df_meditation, df_subjective)
+                        bundle = load_participant_bundle(str(p_dir))
+                        fig = build_combined_overview(bundle.source_key, bundle.df_wristband, bundle.wear_col, bundle.df_sleep, bundle.df_meditation, bundle.df_subjective)
 
                     st.markdown(f"**{pid}**")
                     if fig:
@@ -194,13 +197,13 @@ def run_dashboard() -> None:
     participant_dir = participant_path(data_base_path, selected_participant)
 
     with st.spinner(f"Loading data for {selected_participant}..."):
-        df_wristband, wristband_wear_col = get_wristband_data(str(participant_dir))
-        df_sleep = get_sleep_reports(str(participant_dir))
-        df_meditation = get_meditation_data(str(participant_dir))
-        df_subjective = get_subjective_data(str(participant_dir))
+        bundle = load_participant_bundle(str(participant_dir))
+        df_wristband, wristband_wear_col = bundle.df_wristband, bundle.wear_col
+        df_sleep, df_meditation, df_subjective = bundle.df_sleep, bundle.df_meditation, bundle.df_subjective
         wristband_summary, wristband_summary_hours = summarize_wristband_recordings(df_wristband, wear_col=wristband_wear_col)
         sleep_summary, sleep_summary_hours = summarize_sleep_recordings(df_sleep)
         meditation_summary, meditation_hours = summarize_meditation_recordings(df_meditation)
+        subjective_summary = summarize_subjective_data(df_subjective)
         nights_with_day_cnt, _ = nights_with_following_wristband_day(
             df_sleep, df_wristband, wear_col=wristband_wear_col, coverage_threshold=coverage_threshold
         )
@@ -215,10 +218,10 @@ def run_dashboard() -> None:
         sleep_summary_hours,
         meditation_summary,
         meditation_hours,
-        sleep_diary_sheets=summarize_subjective_data(df_subjective).get("sleep_diary_sheets_with_data", 0),
-        tet_diary_sheets=summarize_subjective_data(df_subjective).get("tet_diary_sheets_with_data", 0),
-        activity_diary_sheets=summarize_subjective_data(df_subjective).get("activity_diary_sheets_with_data", 0),
-        tet_meditation_sheets=summarize_subjective_data(df_subjective).get("tet_meditation_sheets_with_data", 0),
+        sleep_diary_sheets=subjective_summary.get("sleep_diary_sheets_with_data", 0),
+        tet_diary_sheets=subjective_summary.get("tet_diary_sheets_with_data", 0),
+        activity_diary_sheets=subjective_summary.get("activity_diary_sheets_with_data", 0),
+        tet_meditation_sheets=subjective_summary.get("tet_meditation_sheets_with_data", 0),
     )
 
     st.subheader("🔗 Cross-Modality Data Quality Metrics")
@@ -235,10 +238,10 @@ def run_dashboard() -> None:
     ])
 
     with tab1:
-        render_overview_tab(df_wristband, wristband_wear_col, df_sleep, df_meditation, df_subjective)
+        render_overview_tab(bundle.source_key, df_wristband, wristband_wear_col, df_sleep, df_meditation, df_subjective)
 
     with tab2:
-        render_wristband_tab(df_wristband, wristband_wear_col)
+        render_wristband_tab(bundle.source_key, df_wristband, wristband_wear_col)
 
     with tab3:
         render_sleep_tab(df_sleep)
@@ -11,3 +11,6 @@ WEARING_COLOR_MAP = {
     "1-49%": "#ff7f50",
     "0%": "#ff4136",
 }
+
+# Upper bound on points drawn for dense wristband timelines (~2x typical plot width in pixels)
+TIMELINE_MAX_POINTS = 2048
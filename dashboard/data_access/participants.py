@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import os
+from collections import deque
 from pathlib import Path
 from typing import Iterable
 
 
 def list_participants(data_base_path: str | Path) -> list[str]:
-    """Return sorted participant folder names from the base path."""
-    base_path = Path(data_base_path)
-    if not base_path.exists() or not base_path.is_dir():
+    """Return sorted participant folder names from the base path.
+
+    Uses `os.scandir`, whose entries carry the file type from the directory
+    listing, so no extra `stat()` call is needed per entry.
+    """
+    try:
+        with os.scandir(data_base_path) as entries:
+            return sorted(entry.name for entry in entries if entry.is_dir())
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted([item.name for item in base_path.iterdir() if item.is_dir()])
 
 
 def participant_path(data_base_path: str | Path, participant_id: str) -> Path:
@@ -17,15 +24,62 @@ def participant_path(data_base_path: str | Path, participant_id: str) -> Path:
     return Path(data_base_path) / participant_id
 
 
-def iter_aggregated_dirs(participant_dir: str | Path) -> Iterable[Path]:
-    """Yield directories likely containing aggregated per-minute CSV files."""
-    participant_path_obj = Path(participant_dir)
-    if not participant_path_obj.exists():
-        return
+# files the modality loaders read: wearing-detection and Dreem report CSVs,
+# Bitbrain info.json and diary workbooks; raw recordings are never stat'ed
+_LOADER_CSV_HINTS = ("wearing-detection", "report")
+_LOADER_SUFFIXES = (".xls", ".xlsx", ".xlsm")
+
+
+def _is_loader_input(name: str) -> bool:
+    name = name.lower()
+    if name.endswith(".csv"):
+        return any(hint in name for hint in _LOADER_CSV_HINTS)
+    return name == "info.json" or name.endswith(_LOADER_SUFFIXES)
+
+
+def latest_mtime_ns(participant_dir: str | Path) -> int:
+    """Return the newest modification time (ns) of the loader inputs below `participant_dir`.
 
-    for candidate in participant_path_obj.rglob("*"):
-        if not candidate.is_dir():
+    Directory mtimes change when files are added or removed, and the files
+    the loaders read change on edits, so the value works as a cheap change
+    fingerprint for cached loaders. Other files (raw EmbracePlus and EEG
+    dumps) are listed but not stat'ed. Returns 0 if the folder is missing.
+    """
+    latest = 0
+    pending = [os.fspath(participant_dir)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                        pending.append(entry.path)
+                    elif _is_loader_input(entry.name):
+                        latest = max(latest, entry.stat(follow_symlinks=False).st_mtime_ns)
+        except OSError:
             continue
-        lower_name = candidate.name.lower()
-        if "aggr" in lower_name or "aggregated" in lower_name:
-            yield candidate
+    return latest
+
+
+def iter_aggregated_dirs(participant_dir: str | Path, max_depth: int | None = None) -> Iterable[Path]:
+    """Yield directories likely containing aggregated per-minute CSV files.
+
+    Walks the tree breadth-first with `os.scandir`, so only directory entries
+    are inspected and files are never stat'ed. Matched directories are not
+    descended into, hidden directories are skipped, and `max_depth` (1 = direct
+    children) stops the walk early on deep trees.
+    """
+    pending = deque([(os.fspath(participant_dir), 1)])
+    while pending:
+        current, depth = pending.popleft()
+        try:
+            with os.scandir(current) as entries:
+                subdirs = [entry for entry in entries if not entry.name.startswith(".") and entry.is_dir()]
+        except OSError:
+            continue
+
+        for entry in sorted(subdirs, key=lambda e: e.name):
+            if "aggr" in entry.name.lower():
+                yield Path(entry.path)
+            elif not entry.is_symlink() and (max_depth is None or depth < max_depth):
+                pending.append((entry.path, depth + 1))
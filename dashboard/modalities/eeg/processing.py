@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Iterator
 
 import json
+import numpy as np
 import pandas as pd
 import datetime as dt
 
@@ -11,10 +16,35 @@ SLEEP_DIR = Path("EEG") / "Night"
 MEDITATION_DIR = Path("EEG") / "Meditation"
 REPORT_FILE_HINT = "report"
 DREEM_HINT = "dreem"
+# below this many report files, reading them serially beats starting a thread pool
+PARALLEL_MIN_FILES = 4
+# report headers hold a few dozen key/value pairs; never parse further than this
+KEY_VALUE_MAX_ROWS = 200
 
 
 #################### Sleep Loading and Summarization ####################
 
+def _iter_dreem_reports(base: Path) -> Iterator[Path]:
+    """Yield Dreem report CSVs anywhere below `base`.
+
+    Walks the tree with `os.scandir` and filters on the entry names, so
+    non-matching files are never stat'ed or turned into Path objects.
+    """
+    pending = [os.fspath(base)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    name_lower = entry.name.lower()
+                    if name_lower.endswith(".csv") and REPORT_FILE_HINT in name_lower and DREEM_HINT in name_lower and entry.is_file():
+                        yield Path(entry.path)
+        except OSError:
+            continue
+
+
 def is_dreem(participant_path: str | Path, debug: bool = False, base_dir: Path = SLEEP_DIR) -> bool:
     """Return True if any CSV under the given EEG base directory for the
     participant contains both the REPORT_FILE_HINT and DREEM_HINT in its
@@ -29,12 +59,10 @@ def is_dreem(participant_path: str | Path, debug: bool = False, base_dir: Path =
     if not sleep_base.exists() or not sleep_base.is_dir():
         return False
 
-    for csv_path in sleep_base.rglob("*.csv"):
-        name_lower = csv_path.name.lower()
-        if REPORT_FILE_HINT in name_lower and DREEM_HINT in name_lower:
-            if debug:
-                print(f"[EEG] Dreem report found: {csv_path}")
-            return True
+    for csv_path in _iter_dreem_reports(sleep_base):
+        if debug:
+            print(f"[EEG] Dreem report found: {csv_path}")
+        return True
     if debug:
         print(f"[EEG] No Dreem report CSVs found under {sleep_base}")
     return False
@@ -61,8 +89,18 @@ def _read_key_value_csv(csv_path: Path, debug: bool = False) -> dict:
     # Try common separators in order
     for sep in [",", ";", "\t"]:
         try:
-            df_kv = pd.read_csv(csv_path, header=None, names=["key", "value"], sep=sep, engine="python", dtype=str, comment="#")
-        except Exception:
+            df_kv = pd.read_csv(
+                csv_path,
+                header=None,
+                names=["key", "value"],
+                usecols=[0, 1],
+                nrows=KEY_VALUE_MAX_ROWS,
+                sep=sep,
+                dtype=str,
+                comment="#",
+                on_bad_lines="skip",
+            )
+        except (pd.errors.ParserError, pd.errors.EmptyDataError, ValueError, UnicodeDecodeError):
             df_kv = None
 
         if df_kv is None or df_kv.shape[1] < 2:
@@ -97,6 +135,38 @@ def _read_key_value_csv(csv_path: Path, debug: bool = False) -> dict:
         print(f"[EEG] no key/value pairs found in {csv_path}")
     return {}
 
+_RECORD_TIME_KEYS = ("record_start_iso", "record_stop_iso")
+
+
+def _extract_record_times(csv_path: Path) -> tuple[str | None, str | None]:
+    """Scan a Dreem key/value report for `record_start_iso` / `record_stop_iso`.
+
+    Reads line by line and stops as soon as both keys are found, so only the
+    report header is read instead of handing the whole file to pandas.
+    """
+    found: dict[str, str] = {}
+    try:
+        with open(csv_path, encoding="utf-8-sig", errors="replace") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                for sep in (",", ";", "\t"):
+                    if sep in line:
+                        key, _, value = line.partition(sep)
+                        break
+                else:
+                    key, _, value = line.partition(" ")
+                key = key.strip().strip('"').lower()
+                if key in _RECORD_TIME_KEYS:
+                    found[key] = value.strip().strip('"')
+                    if len(found) == len(_RECORD_TIME_KEYS):
+                        break
+    except OSError:
+        return None, None
+    return found.get("record_start_iso"), found.get("record_stop_iso")
+
+
 # Helper function for Bitbrain timestamp parsing
 def ts_to_iso(ts):
     if ts > 1e17:          # likely nanoseconds
@@ -108,17 +178,64 @@ def ts_to_iso(ts):
     return dt.datetime.fromtimestamp(seconds, tz=dt.timezone.utc).isoformat()
 
 
+def _dreem_record_time_strings(csv_path: Path, debug: bool = False) -> tuple[str | None, str | None]:
+    """Return the raw `record_start_iso` / `record_stop_iso` strings of a Dreem report."""
+    record_start_iso, record_stop_iso = _extract_record_times(csv_path)
+    if record_start_iso is None and record_stop_iso is None:
+        # legacy fallback for report layouts the line scanner does not recognize
+        kv = _read_key_value_csv(csv_path, debug=debug)
+        record_start_iso = kv.get("record_start_iso")
+        record_stop_iso = kv.get("record_stop_iso")
+    return record_start_iso, record_stop_iso
+
+
+def _read_report_times(csv_paths: list[Path], debug: bool = False) -> list[tuple[str | None, str | None]]:
+    """Return the raw record times of each report, in input order.
+
+    Reading the reports is I/O bound and releases the GIL, so larger batches
+    are spread over a thread pool to overlap the file reads.
+    """
+    if len(csv_paths) < PARALLEL_MIN_FILES:
+        return [_dreem_record_time_strings(csv_path, debug=debug) for csv_path in csv_paths]
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4)) as executor:
+        return list(executor.map(partial(_dreem_record_time_strings, debug=debug), csv_paths))
+
+
+def _dreem_report_frame(label_col: str, labels: list[str], files: list[str], start_strs: list, stop_strs: list) -> pd.DataFrame:
+    """Parse collected Dreem start/stop strings in one batch.
+
+    Returns `label_col`, `file`, `start`, `stop` and `duration_hours` for the
+    reports with both times valid. Offsets are kept as recorded; if they differ
+    between reports (e.g. across a DST switch) no common dtype exists and the
+    values are parsed one by one, as the per-file loaders used to do.
+    """
+    try:
+        starts = pd.to_datetime(pd.Series(start_strs, dtype=object), errors="coerce", format="ISO8601")
+        stops = pd.to_datetime(pd.Series(stop_strs, dtype=object), errors="coerce", format="ISO8601")
+    except ValueError:
+        starts = pd.Series([pd.to_datetime(v, errors="coerce") for v in start_strs], dtype=object)
+        stops = pd.Series([pd.to_datetime(v, errors="coerce") for v in stop_strs], dtype=object)
+
+    df = pd.DataFrame({label_col: labels, "file": files, "start": starts, "stop": stops}).dropna(subset=["start", "stop"])
+    df["duration_hours"] = _duration_hours(df["start"], df["stop"])
+    return df.reset_index(drop=True)
+
+
+def _duration_hours(starts: pd.Series, stops: pd.Series) -> pd.Series:
+    """Return stop - start in hours, with negative spans clipped to 0."""
+    if starts.dtype.kind == "M" and stops.dtype.kind == "M":
+        durations = (stops - starts).dt.total_seconds()
+    else:
+        durations = pd.Series([(b - a).total_seconds() for a, b in zip(starts, stops)], index=starts.index, dtype=float)
+    return durations.clip(lower=0) / 3600
+
+
 def parse_dreem_csv_times(csv_path: Path, debug: bool = False) -> tuple[pd.Timestamp | pd.NaT, pd.Timestamp | pd.NaT]:
     """Parse `record_start_iso` / `record_stop_iso` from a Dreem report CSV.
 
     Returns (start, stop) as pandas Timestamps or pd.NaT on failure.
     """
-    kv = _read_key_value_csv(csv_path, debug=debug)
-    if not kv:
-        return pd.NaT, pd.NaT
-
-    record_start_iso = kv.get("record_start_iso")
-    record_stop_iso = kv.get("record_stop_iso")
+    record_start_iso, record_stop_iso = _dreem_record_time_strings(csv_path, debug=debug)
     start = pd.NaT
     stop = pd.NaT
     if record_start_iso:
@@ -182,7 +299,7 @@ def parse_bitbrain_info_times(info_file: Path, debug: bool = False) -> tuple[pd.
     return pd.NaT, pd.NaT
 
 
-def load_sleep_reports(participant_path: str | Path, debug: bool = True) -> pd.DataFrame:
+def load_sleep_reports(participant_path: str | Path, debug: bool = False) -> pd.DataFrame:
     """Collect record start/stop times from EEG recordings. 
     Dreem: report CSVs.
     Bitbrain: info.json files
@@ -227,7 +344,6 @@ def load_sleep_reports(participant_path: str | Path, debug: bool = True) -> pd.D
                 night_name = info_file.parent.parent.name
 
             company = "Bitbrain"
-            duration_hours = (stop - start).total_seconds() / 3600 if stop > start else 0.0
 
             records.append(
                 {
@@ -235,42 +351,26 @@ def load_sleep_reports(participant_path: str | Path, debug: bool = True) -> pd.D
                     "file": info_file.name,
                     "start": start,
                     "stop": stop,
-                    "duration_hours": duration_hours,
                     "company": company,
                 }
             )
 
         # return records found for Bitbrain (or empty)
-        return pd.DataFrame.from_records(records)
+        df_sleep = pd.DataFrame.from_records(records)
+        if not df_sleep.empty:
+            df_sleep.insert(4, "duration_hours", _duration_hours(df_sleep["start"], df_sleep["stop"]))
+        return df_sleep
 
     # If Dreem, proceed to examine discovered CSVs as before
     
-    # Recursively search for CSV files under the sleep base directory so that
-    # CSVs stored in deeper subfolders are also discovered.
-    all_csvs = list(sleep_base.rglob("*.csv")) if sleep_base.exists() else []
-    if debug:
-        print(f"[EEG] discovered_csv_count={len(all_csvs)}")
-        for p in all_csvs[:20]:
-            print(f"[EEG] found_csv: {p}")
-
-    for csv_path in all_csvs:
-        if not csv_path.is_file():
-            if debug:
-                print(f"[EEG] skipping_non_file: {csv_path}")
-            continue
-
-        name_lower = csv_path.name.lower()
-        has_report = REPORT_FILE_HINT in name_lower
-        has_dreem = DREEM_HINT in name_lower
+    # Recursively search for Dreem report CSVs under the sleep base directory so
+    # that reports stored in deeper subfolders are also discovered. The raw time
+    # strings are read afterwards and parsed in one batch.
+    nights: list[str] = []
+    csv_paths: list[Path] = []
+    for csv_path in _iter_dreem_reports(sleep_base):
         if debug:
-            print(f"[EEG] checking: {csv_path.name} report={has_report} dreem={has_dreem}")
-
-        if not has_report:
-            continue
-        if not has_dreem:
-            if debug:
-                print(f"[EEG] skipping (not Dreem): {csv_path.name}")
-            continue
+            print(f"[EEG] found_report: {csv_path}")
 
         # Derive the top-level night folder name relative to the sleep base.
         try:
@@ -282,35 +382,19 @@ def load_sleep_reports(participant_path: str | Path, debug: bool = True) -> pd.D
         if debug:
             print(f"[EEG] night_name derived: {night_name}")
 
-        # Prefer key/value parsing for Dreem report files which list rows as
-        # `key,value` pairs (no header). Fall back to table parsing if needed.
-        start = pd.NaT
-        stop = pd.NaT
-        # add company label
-        company = "Dreem"
+        nights.append(night_name)
+        csv_paths.append(csv_path)
 
-        # Try key/value parsing first (matches provided example CSV)
-        start, stop = parse_dreem_csv_times(csv_path, debug=debug)
-
-
-        if pd.isna(start) or pd.isna(stop):
-            if debug:
-                print(f"Still [EEG] missing start/stop for {csv_path.name}, skipping")
-            continue
-
-        duration_hours = (stop - start).total_seconds() / 3600 if stop > start else 0.0
-
-        records.append(
-            {
-                "night": night_name,
-                "file": csv_path.name,
-                "start": start,
-                "stop": stop,
-                "duration_hours": duration_hours,
-                "company": company,
-            }
-        )
-    return pd.DataFrame.from_records(records)
+    # Dreem report files list rows as `key,value` pairs (no header)
+    times = _read_report_times(csv_paths, debug=debug)
+    files = [csv_path.name for csv_path in csv_paths]
+    df_sleep = _dreem_report_frame("night", nights, files, [t[0] for t in times], [t[1] for t in times])
+    if debug and len(df_sleep) < len(files):
+        print(f"[EEG] skipped {len(files) - len(df_sleep)} report(s) with missing/invalid start/stop")
+    if df_sleep.empty:
+        return pd.DataFrame()
+    df_sleep["company"] = "Dreem"
+    return df_sleep
 
 
 def summarize_sleep_recordings(df_sleep: pd.DataFrame) -> tuple[int, float]:
@@ -319,13 +403,13 @@ def summarize_sleep_recordings(df_sleep: pd.DataFrame) -> tuple[int, float]:
         return 0, 0.0
 
     nights = int(df_sleep["night"].nunique()) if "night" in df_sleep.columns else 0
-    total_hours = float(df_sleep.get("duration_hours", pd.Series(dtype=float)).sum())
+    total_hours = float(np.nansum(df_sleep["duration_hours"].to_numpy(dtype=float))) if "duration_hours" in df_sleep.columns else 0.0
     return nights, total_hours
 
 
 
 ####################### Meditation Loading and Summarization #######################
-def load_meditation_reports(participant_path: str | Path, debug: bool = True) -> pd.DataFrame:
+def load_meditation_reports(participant_path: str | Path, debug: bool = False) -> pd.DataFrame:
     """Collect record start/stop times from Dreem meditation report CSVs.
 
     For each meditation folder under the participant's EEG meditation directory, the
@@ -369,43 +453,27 @@ def load_meditation_reports(participant_path: str | Path, debug: bool = True) ->
                 session = info_file.parent.parent.name
 
             company = "Bitbrain"
-            duration_hours = (stop - start).total_seconds() / 3600 if stop > start else 0.0
-            
+
             records.append(
                 {
                     "session": session,
                     "file": info_file.name,
                     "start": start,
                     "stop": stop,
-                    "duration_minutes": duration_hours * 60,
                     "company": company,
                 }
             )
-        return pd.DataFrame.from_records(records)
-
-    # Dreem: discover CSVs and parse using shared helper
-    all_csvs = list(meditation_base.rglob("*.csv")) if meditation_base.exists() else []
-    if debug:
-        print(f"[Meditation] discovered_csv_count={len(all_csvs)}")
-        for p in all_csvs[:20]:
-            print(f"[Meditation] found_csv: {p}")
-
-    for csv_path in all_csvs:
-        if not csv_path.is_file():
-            if debug:
-                print(f"[Meditation] skipping_non_file: {csv_path}")
-            continue
-
-        name_lower = csv_path.name.lower()
-        has_report = REPORT_FILE_HINT in name_lower
-        has_dreem = DREEM_HINT in name_lower
+        df_meditation = pd.DataFrame.from_records(records)
+        if not df_meditation.empty:
+            df_meditation.insert(4, "duration_minutes", _duration_hours(df_meditation["start"], df_meditation["stop"]) * 60)
+        return df_meditation
+
+    # Dreem: discover report CSVs, read their raw times and parse them in one batch
+    sessions: list[str] = []
+    csv_paths: list[Path] = []
+    for csv_path in _iter_dreem_reports(meditation_base):
         if debug:
-            print(f"[Meditation] checking: {csv_path.name} report={has_report} dreem={has_dreem}")
-
-        if not has_report or not has_dreem:
-            if debug:
-                print(f"[Meditation] skipping (not Dreem): {csv_path.name}")
-            continue
+            print(f"[Meditation] found_report: {csv_path}")
 
         try:
             rel = csv_path.relative_to(meditation_base)
@@ -413,27 +481,19 @@ def load_meditation_reports(participant_path: str | Path, debug: bool = True) ->
         except Exception:
             session = csv_path.parent.name
 
-        start, stop = parse_dreem_csv_times(csv_path, debug=debug)
-        if pd.isna(start) or pd.isna(stop):
-            if debug:
-                print(f"Still [Meditation] missing start/stop for {csv_path.name}, skipping")
-            continue
+        sessions.append(session)
+        csv_paths.append(csv_path)
 
-        company = "Dreem"
-        duration_hours = (stop - start).total_seconds() / 3600 if stop > start else 0.0
-        
-        records.append(
-            {
-                "session": session,
-                "file": csv_path.name,
-                "start": start,
-                "stop": stop,
-                "duration_minutes": duration_hours * 60,
-                "company": company,
-            }
-        )
-
-    return pd.DataFrame.from_records(records)
+    times = _read_report_times(csv_paths, debug=debug)
+    files = [csv_path.name for csv_path in csv_paths]
+    df_meditation = _dreem_report_frame("session", sessions, files, [t[0] for t in times], [t[1] for t in times])
+    if debug and len(df_meditation) < len(files):
+        print(f"[Meditation] skipped {len(files) - len(df_meditation)} report(s) with missing/invalid start/stop")
+    if df_meditation.empty:
+        return pd.DataFrame()
+    df_meditation["duration_minutes"] = df_meditation.pop("duration_hours") * 60
+    df_meditation["company"] = "Dreem"
+    return df_meditation
 
 def summarize_meditation_recordings(df_meditation: pd.DataFrame) -> tuple[int, float]:
     """Return (sessions_with_data, total_minutes_recorded)."""
@@ -441,5 +501,6 @@ def summarize_meditation_recordings(df_meditation: pd.DataFrame) -> tuple[int, f
         return 0, 0.0
 
     sessions = int(df_meditation["session"].nunique()) if "session" in df_meditation.columns else 0
-    total_hours = float(df_meditation.get("duration_minutes", pd.Series(dtype=float)).sum()) / 60
+    total_minutes = float(np.nansum(df_meditation["duration_minutes"].to_numpy(dtype=float))) if "duration_minutes" in df_meditation.columns else 0.0
+    total_hours = total_minutes / 60
     return sessions, total_hours
\ No newline at end of file
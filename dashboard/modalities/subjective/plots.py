@@ -4,6 +4,9 @@ import pandas as pd
 import plotly.graph_objects as go
 import numpy as np
 
+# Shared placeholder returned when there is nothing to plot; callers must not mutate it
+_EMPTY_FIGURE = go.Figure()
+
 ############# Subjective Data Plots #############   
 
 def plot_subjective_availability_heatmap(
@@ -12,7 +15,7 @@ def plot_subjective_availability_heatmap(
 ) -> go.Figure:
     """Heatmap showing per-day availability of subjective records."""
     if df_subjective is None or df_subjective.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     sources = ["sleep_diary", "activity_diary", "tet_diary", "tet_meditation"]
 
@@ -20,14 +23,14 @@ def plot_subjective_availability_heatmap(
     df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
     df = df.dropna(subset=[date_col])
     if df.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     # normalize to calendar days; prefer matched_date if available
     date_source = "matched_date" if "matched_date" in df.columns else date_col
     df["_date"] = pd.to_datetime(df[date_source], errors="coerce").dt.normalize()
     df = df.dropna(subset=["_date"])
     if df.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     # full date range (inclusive)
     min_date = df["_date"].min()
@@ -53,7 +56,7 @@ def plot_subjective_availability_heatmap(
     df["section"] = df["section"].apply(_normalize_section)
     df = df[df["section"].isin(sources)]
     if df.empty:
-        return go.Figure()
+        return _EMPTY_FIGURE
 
     df["has_data"] = 1
     availability = (
@@ -75,7 +78,12 @@ def plot_subjective_availability_heatmap(
         [1.0, "#2ca02c"],
     ]
 
-    fig = go.Figure(
+    # make x tick labels sparser if many days
+    xaxis = dict(title="Date", tickangle=45)
+    if len(x_labels) > 40:
+        xaxis["nticks"] = 15
+
+    return go.Figure(
         data=[
             go.Heatmap(
                 z=z,
@@ -95,22 +103,13 @@ def plot_subjective_availability_heatmap(
                 xgap=1,
                 ygap=1,
             )
-        ]
-    )
-
-    fig.update_layout(
-        title="Subjective Data Availability (per day)",
-        xaxis_title="Date",
-        yaxis_title="Source",
-        template="plotly_white",
-        height=min(900, 40 * max(1, len(y_labels)) + 200),
-        margin=dict(l=100, r=40, t=80, b=120),
+        ],
+        layout=dict(
+            title="Subjective Data Availability (per day)",
+            xaxis=xaxis,
+            yaxis_title="Source",
+            template="plotly_white",
+            height=min(900, 40 * max(1, len(y_labels)) + 200),
+            margin=dict(l=100, r=40, t=80, b=120),
+        ),
     )
-
-    # make x tick labels sparser if many days
-    if len(x_labels) > 40:
-        fig.update_xaxes(tickangle=45, nticks=15)
-    else:
-        fig.update_xaxes(tickangle=45)
-
-    return fig
\ No newline at end of file
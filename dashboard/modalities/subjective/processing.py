@@ -1,15 +1,58 @@
 from __future__ import annotations
 
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
 import re
 
+try:
+    import python_calamine  # backs pandas' "calamine" engine, which releases the GIL
+except ImportError:
+    python_calamine = None
+
+try:
+    import openpyxl
+except ImportError:  # only needed when calamine is unavailable
+    openpyxl = None
+
 
 # Base folders relative to the participant directory (use Path for reliable joins)
 SUBJECTIVE_DIR = Path("App")
 DAILY_HINT = "App"
 TEMP_PREFIX = "~$"
+EXCEL_SUFFIXES = (".xls", ".xlsx", ".xlsm")
+# below this many workbooks, reading them serially beats starting a thread pool
+PARALLEL_MIN_FILES = 4
+# pandas' default `na_values` (pandas._libs.parsers.STR_NA_VALUES): read_excel + dropna
+# treated cells holding only these markers as empty
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+# Date/time inside diary strings; allows fractional seconds (dot or comma) and stops before trailing text
+_DATETIME_RE = re.compile(r"\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?")
+
+# Columns of the per-sheet availability rows, in order
+RECORD_COLUMNS = (
+    "participant",
+    "file",
+    "section",
+    "sheet_index",
+    "sheet_name",
+    "has_data",
+    "recording_date",
+    "recording_date_iso",
+    "first_entry_raw",
+    "expected",
+    "color",
+    "color_int",
+)
 
 # Map logical sections to substrings that should appear in the Excel sheet names.
 # This lets us match sheets regardless of their order within the workbook.
@@ -23,200 +66,312 @@ SECTION_PATTERNS: dict[str, tuple[str, ...]] = {
 
 #################### Subjective data Loading and Summarization ####################
 
-def load_subjective_data(participant_path: str | Path, debug: bool = True) -> pd.DataFrame:
-    """Read in excel files with subjective data (sleep diary, tet diary, activity diary, meditation diary) and concatenate into a single tidy frame.
-    The function looks for Excel files under the participant's "App" directory (and subdirectories) that contain the hint "App" in their name. 
-    
-    Returns a tidy frame ready for plotting.
+def _iter_diary_workbooks(base: Path) -> Iterator[Path]:
+    """Yield diary workbooks (.xls, .xlsx, .xlsm with DAILY_HINT in the name) anywhere below `base`.
+
+    Office temp/lock files that start with the prefix "~$" are skipped. Walks
+    the tree with `os.scandir` and filters on the entry names, so
+    non-matching files are never stat'ed or turned into Path objects.
     """
+    pending = [os.fspath(base)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    name = entry.name
+                    if (
+                        name.lower().endswith(EXCEL_SUFFIXES)
+                        and not name.startswith(TEMP_PREFIX)
+                        and DAILY_HINT in name
+                        and entry.is_file()
+                    ):
+                        yield Path(entry.path)
+        except OSError:
+            continue
 
-    participant_dir = Path(participant_path)
-    subjective_base = participant_dir / SUBJECTIVE_DIR
 
-    if debug:
-        print(f"[SUBJECTIVE] participant_dir={participant_dir}")
-        print(f"[SUBJECTIVE] subjective_base={subjective_base} exists={subjective_base.exists()}")
+def _open_workbook(excel_path: Path):
+    """Open a workbook with the Rust-based calamine reader when it is installed.
 
-    if not subjective_base.exists() or not subjective_base.is_dir():
-        return pd.DataFrame()
+    Otherwise .xlsx/.xlsm files are opened as a streaming openpyxl workbook
+    (see `_sheet_tail`) and anything else with pandas' default engine.
+    """
+    try:
+        return pd.ExcelFile(excel_path, engine="calamine")
+    except ImportError:
+        pass
+    if openpyxl is not None and excel_path.suffix.lower() in (".xlsx", ".xlsm"):
+        return openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+    return pd.ExcelFile(excel_path)
+
+
+def _match_section_sheets(
+    sheet_names: list[str], sections: list[str], debug: bool = False, workbook_name: str = ""
+) -> dict[str, str]:
+    """Map each section to a sheet of the workbook in one pass.
+
+    Sections are resolved in order, matching sheet names by alias rather
+    than brute index and falling back to the positional sheet; a sheet is
+    used for at most one section. Unmatched sections are left out.
+    """
+    lower_names = [name.lower() for name in sheet_names]
+    used: set[int] = set()
+    mapping: dict[str, str] = {}
+    for idx, section in enumerate(sections):
+        patterns = SECTION_PATTERNS.get(section, ())
+        match = next(
+            (i for i, lower in enumerate(lower_names) if i not in used and any(p in lower for p in patterns)),
+            None,
+        )
+        if match is not None:
+            if debug:
+                print(f"[SUBJECTIVE] matched_sheet section={section} pattern_match={sheet_names[match]} in {workbook_name}")
+        # Fallback: use positional sheet if alias search failed
+        elif idx < len(sheet_names) and idx not in used:
+            match = idx
+            if debug:
+                print(f"[SUBJECTIVE] fallback_sheet section={section} idx={idx} -> {sheet_names[idx]} in {workbook_name}")
+        if match is not None:
+            used.add(match)
+            mapping[section] = sheet_names[match]
+    return mapping
 
-    records: list[dict[str, object]] = []
 
-    # Look for Excel files (.xls, .xlsx, .xlsm) under the subjective base directory
-    # but skip Office temp/lock files that start with the prefix "~$".
-    excel_files = [p for p in subjective_base.rglob("*.xls*") if not p.name.startswith(TEMP_PREFIX) and DAILY_HINT in p.name] if subjective_base.exists() else []
-    if debug:
-        print(f"[SUBJECTIVE] discovered_excel_count={len(excel_files)}")
-        for p in excel_files[:20]:
-            print(f"[SUBJECTIVE] found_excel: {p}")
+def _is_blank(value: object) -> bool:
+    """True for cells `read_excel` + `dropna` treated as empty.
 
-    # We expect up to 4 relevant sheets per file in the following logical order
-    sections = ["sleep_diary", "tet_diary", "activity_diary", "tet_meditation"]
+    That is None/NaN, "" (calamine's empty cell) and pandas' default NA
+    markers such as "NA" or "n/a", also with surrounding spaces.
+    Whitespace-only strings count as data, as they did before.
+    """
+    if isinstance(value, str):
+        stripped = value.strip()
+        return value == "" or (stripped != "" and stripped in _NA_STRINGS)
+    return value is None or (isinstance(value, float) and value != value)
 
-    for excel_path in excel_files:
-        if not excel_path.is_file():
-            if debug:
-                print(f"[SUBJECTIVE] skipping_non_file: {excel_path}")
-            continue
 
-        # skip Excel temporary/lock files created by Office (names starting with "~$")
-        if excel_path.name.startswith(TEMP_PREFIX):
-            if debug:
-                print(f"[SUBJECTIVE] skipping_temp_file: {excel_path.name}")
-            continue
-        if DAILY_HINT not in excel_path.name:
+def _sheet_tail(xl, sheet_name: str) -> tuple[bool, list | tuple | None]:
+    """Return (has_data, second_to_last_data_row) for one sheet.
+
+    Data rows are the non-blank rows below the header. Raw cell rows are
+    scanned without building a DataFrame: bottom-up for in-memory sheets,
+    stopping at the second data row found, and with a two-row ring buffer for
+    streaming openpyxl workbooks.
+    """
+    if isinstance(xl, pd.ExcelFile):
+        if xl.engine == "calamine":
+            rows = xl.book.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+        else:
+            rows = xl.parse(sheet_name, header=None).to_numpy(dtype=object).tolist()
+        tail = []
+        for row in reversed(rows[1:]):
+            if not all(_is_blank(v) for v in row):
+                tail.append(row)
+                if len(tail) == 2:
+                    break
+        return bool(tail), tail[1] if len(tail) == 2 else None
+
+    ws = xl[sheet_name]
+    # read-only mode trusts the sheet dimension stored in the file, which some
+    # writers get wrong (truncating the scan); reset it to read every row
+    ws.reset_dimensions()
+    rows = ws.iter_rows(values_only=True)
+    next(rows, None)  # header
+    ring: deque[tuple] = deque(maxlen=2)
+    for row in rows:
+        if not all(_is_blank(v) for v in row):
+            ring.append(row)
+    return bool(ring), ring[0] if len(ring) == 2 else None
+
+
+def _process_workbook(excel_path: Path, participant_name: str, sections: list[str], debug: bool = False) -> list[tuple]:
+    """Return one availability row per section for a single diary workbook.
+
+    Rows hold the values of RECORD_COLUMNS in order; workbooks that cannot be
+    opened yield no rows.
+    """
+    try:
+        xl = _open_workbook(excel_path)
+    except Exception as exc:
+        if debug:
+            print(f"[SUBJECTIVE] failed_read_excel {excel_path}: {exc}")
+        return []
+
+    sheet_names = xl.sheet_names if isinstance(xl, pd.ExcelFile) else xl.sheetnames
+    section_sheets = _match_section_sheets(sheet_names, sections, debug=debug, workbook_name=excel_path.name)
+
+    records: list[dict[str, object]] = []
+
+    # only sheets mapped to a section are parsed
+    for idx, section in enumerate(sections):
+        record: dict[str, object] = {
+            "participant": participant_name,
+            "file": str(excel_path),
+            "section": section,
+            "sheet_index": idx,
+            "sheet_name": None,
+            "has_data": False,
+            "recording_date": pd.NaT,
+            "recording_date_iso": None,
+            "first_entry_raw": None,
+            "expected": False,
+            "color": None, 
+            "color_int": None,
+        }
+
+        sheet_name = section_sheets.get(section)
+        if sheet_name is None:
             if debug:
-                print(f"[SUBJECTIVE] skipping (hint not in name): {excel_path.name}")
+                print(f"[SUBJECTIVE] missing_sheet section={section} for {excel_path.name}")
+            records.append(record)
             continue
 
+        record["sheet_name"] = sheet_name
+
         try:
-            xl = pd.ExcelFile(excel_path)
+            has_rows, last_row = _sheet_tail(xl, sheet_name)
         except Exception as exc:
             if debug:
-                print(f"[SUBJECTIVE] failed_read_excel {excel_path}: {exc}")
+                print(f"[SUBJECTIVE] failed_parse_sheet {sheet_name} in {excel_path}: {exc}")
+            records.append(record)
             continue
 
-        sheet_names = xl.sheet_names
-        used_sheet_names: set[str] = set()
-
-        # iterate expected sections, matching sheet names by alias rather than brute index
-        for idx, section in enumerate(sections):
-            record: dict[str, object] = {
-                "participant": participant_dir.name,
-                "file": str(excel_path),
-                "section": section,
-                "sheet_index": idx,
-                "sheet_name": None,
-                "has_data": False,
-                "recording_date": pd.NaT,
-                "recording_date_iso": None,
-                "first_entry_raw": None,
-                "expected": False,
-                "color": None, 
-                "color_int": None,
-            }
-
-            patterns = SECTION_PATTERNS.get(section, ())
-            sheet_name = None
-
-            if patterns:
-                for candidate in sheet_names:
-                    if candidate in used_sheet_names:
-                        continue
-                    lower_candidate = candidate.lower()
-                    if any(pattern in lower_candidate for pattern in patterns):
-                        sheet_name = candidate
-                        if debug:
-                            print(
-                                f"[SUBJECTIVE] matched_sheet section={section} pattern_match={candidate} in {excel_path.name}"
-                            )
-                        break
-
-            # Fallback: use positional sheet if alias search failed
-            if sheet_name is None and idx < len(sheet_names):
-                candidate = sheet_names[idx]
-                if candidate not in used_sheet_names:
-                    sheet_name = candidate
-                    if debug:
-                        print(
-                            f"[SUBJECTIVE] fallback_sheet section={section} idx={idx} -> {candidate} in {excel_path.name}"
-                        )
-
-            if sheet_name is None:
-                if debug:
-                    print(f"[SUBJECTIVE] missing_sheet section={section} for {excel_path.name}")
-                records.append(record)
-                continue
+        # Only rows with at least one value count when assessing whether the sheet contains data
+        if not has_rows:
+            # sheet contains no data
+            record["has_data"] = False
+            records.append(record)
+            if debug:
+                print(f"[SUBJECTIVE] sheet_empty: {excel_path.name} -> {sheet_name}")
+            continue
 
-            used_sheet_names.add(sheet_name)
-            record["sheet_name"] = sheet_name
+        record["has_data"] = True
+        if last_row is None:
+            # a single data row carries no recording date
+            records.append(record)
+            continue
 
-            try:
-                df = xl.parse(sheet_name, header=0)
-            except Exception:
-                # fallback: try reading without header
+        # Determine recording date: "first entry in the last row"
+        try:
+            # pick the first non-null entry in the last row (safer than iloc[0])
+            first_entry = None
+            for v in last_row:
+                if pd.notna(v) and str(v).strip() != "":
+                    first_entry = v
+                    break
+
+            # always store the raw first_entry for inspection
+            if first_entry is not None:
                 try:
-                    df = xl.parse(sheet_name, header=None)
-                except Exception as exc:
+                    record["first_entry_raw"] = str(first_entry)
+                except Exception:
+                    record["first_entry_raw"] = None
+            
+            # If it's a string like "2024-09-30 21:03:13.560 nachm.", extract the date/time substring;
+            # otherwise try parsing the raw value (unmatched strings stay in first_entry_raw for inspection)
+            parsed_candidate = first_entry
+            recording_date = None
+            if isinstance(first_entry, str):
+                m = _DATETIME_RE.search(first_entry)
+                if m:
+                    parsed_candidate = m.group(0).replace(",", ".")
                     if debug:
-                        print(f"[SUBJECTIVE] failed_parse_sheet {sheet_name} in {excel_path}: {exc}")
-                    records.append(record)
-                    continue
-
-            # Remove rows and columns that are completely NA to assess whether sheet contains data
-            df_clean = df.dropna(how="all").dropna(axis=1, how="all")
-            if df_clean.shape[0] == 0:
-                # sheet contains no data
-                record["has_data"] = False
-                records.append(record)
-                if debug:
-                    print(f"[SUBJECTIVE] sheet_empty: {excel_path.name} -> {sheet_name}")
-                continue
-
-            record["has_data"] = True
-
-            # Determine recording date: "first entry in the last row"
-            try:
-                last_row = df_clean.iloc[-2]
-                # pick the first non-null entry in the last row (safer than iloc[0])
-                first_entry = None
-                for v in last_row:
-                    if pd.notna(v) and str(v).strip() != "":
-                        first_entry = v
-                        break
-
-                # always store the raw first_entry for inspection
-                if first_entry is not None:
+                        print(f"[SUBJECTIVE] extracted_datetime: {parsed_candidate} from sheet {sheet_name}")
+                    # the matched shape is ISO 8601 unless it uses "/" separators
                     try:
-                        record["first_entry_raw"] = str(first_entry)
-                    except Exception:
-                        record["first_entry_raw"] = None
-                
-                # If it's a string like "2024-09-30 21:03:13.560 nachm.", extract the date/time substring
-                if isinstance(first_entry, str):
-                    
-                    # regex allows fractional seconds (dot or comma) and stops before trailing text
-                    m = re.search(r"\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?", first_entry)
-                    if m:
-                        first_entry = m.group(0).replace(",", ".")
-                        if debug:
-                            print(f"[SUBJECTIVE] extracted_datetime: {first_entry} from sheet {sheet_name}")
-
-                # prefer regex-extracted timestamp; otherwise try parsing the raw value
-                if isinstance(first_entry, str):
-                    m = re.search(r"\d{4}[-/]\d{2}[-/]\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?", first_entry)
-                    if m:
-                        parsed_candidate = m.group(0).replace(",", ".")
-                        if debug:
-                            print(f"[SUBJECTIVE] extracted_datetime: {parsed_candidate} from sheet {sheet_name}")
-                    else:
-                        # no regex match — keep the raw string in first_entry_raw for inspection
-                        parsed_candidate = first_entry
-                else:
-                    parsed_candidate = first_entry
-                
+                        recording_date = pd.Timestamp(datetime.fromisoformat(parsed_candidate))
+                    except ValueError:
+                        pass
 
+            if recording_date is None:
                 recording_date = pd.to_datetime(parsed_candidate, errors="coerce") if parsed_candidate is not None else pd.NaT
-                record["recording_date"] = recording_date
-                if debug:
-                    print(
-                        f"[SUBJECTIVE] parsed_recording_date: {recording_date} (type={type(recording_date)}) from sheet {sheet_name} in {excel_path.name}"
-                    )
-                # store ISO string for easier downstream consumption
-                try:
-                    record["recording_date_iso"] = recording_date.isoformat() if pd.notna(recording_date) else None
-                except Exception:
-                    record["recording_date_iso"] = None
+            record["recording_date"] = recording_date
+            if debug:
+                print(
+                    f"[SUBJECTIVE] parsed_recording_date: {recording_date} (type={type(recording_date)}) from sheet {sheet_name} in {excel_path.name}"
+                )
+            # store ISO string for easier downstream consumption
+            try:
+                record["recording_date_iso"] = recording_date.isoformat() if pd.notna(recording_date) else None
             except Exception:
-                record["recording_date"] = pd.NaT
                 record["recording_date_iso"] = None
+        except Exception:
+            record["recording_date"] = pd.NaT
+            record["recording_date_iso"] = None
 
-            records.append(record)
+        records.append(record)
+
+    xl.close()
+    return [tuple(record[col] for col in RECORD_COLUMNS) for record in records]
+
+
+@lru_cache(maxsize=256)
+def _parse_workbook_records(
+    path_str: str, mtime_ns: int, size: int, participant_name: str, sections: tuple[str, ...]
+) -> tuple[tuple, ...]:
+    """Cached `_process_workbook`; `mtime_ns` and `size` only key the cache so edits invalidate it."""
+    return tuple(_process_workbook(Path(path_str), participant_name, list(sections)))
+
+
+def _workbook_records(excel_path: Path, participant_name: str, sections: list[str], debug: bool = False) -> tuple[tuple, ...]:
+    """Return the rows of one workbook, re-parsing it only when it changed on disk."""
+    if debug:
+        # bypass the cache so the parse trace is printed
+        return tuple(_process_workbook(excel_path, participant_name, sections, debug=True))
+    try:
+        stat = excel_path.stat()
+    except OSError:
+        return ()
+    return _parse_workbook_records(str(excel_path), stat.st_mtime_ns, stat.st_size, participant_name, tuple(sections))
+
+
+def load_subjective_data(participant_path: str | Path, debug: bool = False) -> pd.DataFrame:
+    """Read in excel files with subjective data (sleep diary, tet diary, activity diary, meditation diary) and concatenate into a single tidy frame.
+    The function looks for Excel files under the participant's "App" directory (and subdirectories) that contain the hint "App" in their name. 
+    
+    Returns a tidy frame ready for plotting.
+    """
+
+    participant_dir = Path(participant_path)
+    subjective_base = participant_dir / SUBJECTIVE_DIR
+
+    if debug:
+        print(f"[SUBJECTIVE] participant_dir={participant_dir}")
+        print(f"[SUBJECTIVE] subjective_base={subjective_base} exists={subjective_base.exists()}")
+
+    if not subjective_base.exists() or not subjective_base.is_dir():
+        return pd.DataFrame()
+
+    rows: list[tuple] = []
+
+    excel_files = list(_iter_diary_workbooks(subjective_base))
+    if debug:
+        print(f"[SUBJECTIVE] discovered_excel_count={len(excel_files)}")
+        for p in excel_files[:20]:
+            print(f"[SUBJECTIVE] found_excel: {p}")
+
+    # We expect up to 4 relevant sheets per file in the following logical order
+    sections = ["sleep_diary", "tet_diary", "activity_diary", "tet_meditation"]
 
-    df = pd.DataFrame.from_records(records)
-    # Ensure both columns exist and have stable types
-    if "recording_date_iso" not in df.columns:
-        df["recording_date_iso"] = None
+    if debug or python_calamine is None or len(excel_files) < PARALLEL_MIN_FILES:
+        # serial when debugging so the per-workbook output stays in order, and without
+        # calamine: the openpyxl fallback is pure Python, so threads would only contend
+        for excel_path in excel_files:
+            rows.extend(_workbook_records(excel_path, participant_dir.name, sections, debug=debug))
+    else:
+        # workbooks are independent; calamine parses them in Rust without holding the GIL
+        with ThreadPoolExecutor(max_workers=min(8, len(excel_files))) as executor:
+            for workbook_rows in executor.map(
+                partial(_workbook_records, participant_name=participant_dir.name, sections=sections), excel_files
+            ):
+                rows.extend(workbook_rows)
+
+    # build the frame column-wise; the fixed columns also keep an empty frame well-formed
+    columns = list(zip(*rows)) if rows else [[] for _ in RECORD_COLUMNS]
+    df = pd.DataFrame(dict(zip(RECORD_COLUMNS, columns)))
     # Coerce recording_date to datetime dtype
     df["recording_date"] = pd.to_datetime(df["recording_date"], errors="coerce")
 
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import pandas as pd
+
+
+# trailing UTC offset of an ISO timestamp ("Z", "+01:00", "-0500")
+_UTC_OFFSET = r"(?:Z|[+-]\d{2}:?\d{2})$"
+
+
+def to_wall_clock(values: pd.Series) -> pd.Series:
+    """Return `values` as naive datetime64 in the local clock time they were recorded in.
+
+    Every modality uses this convention: each value's own UTC offset is
+    dropped instead of converting to UTC, so recordings on both sides of a
+    DST switch keep their local times and all rows share one time axis.
+    Unparseable values become NaT.
+    """
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        return values.dt.tz_localize(None)
+    if values.dtype.kind == "M":
+        return values
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind == "datetime":
+        # Timestamp objects with differing offsets, e.g. reports parsed one by one
+        values = values.map(lambda ts: ts.replace(tzinfo=None), na_action="ignore")
+    elif kind == "string":
+        values = values.str.replace(_UTC_OFFSET, "", regex=True)
+    parsed = pd.to_datetime(values, errors="coerce", format="ISO8601" if kind == "string" else None)
+    return parsed.dt.tz_localize(None) if isinstance(parsed.dtype, pd.DatetimeTZDtype) else parsed
+
+
+__all__ = ["to_wall_clock"]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def _as_float(times: np.ndarray) -> np.ndarray:
+    """Return time values as float64 offsets from the first sample (datetime64 in ns)."""
+    if times.dtype.kind == "M":
+        numeric = times.astype("datetime64[ns]").astype(np.int64)
+    else:
+        numeric = times.astype(np.float64)
+    return (numeric - numeric[0]).astype(np.float64)
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Return indices selected by Largest-Triangle-Three-Buckets for sorted `x`."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # NaN values have no geometry; treat them as zero for selection only
+    y = np.nan_to_num(y.astype(np.float64), nan=0.0)
+
+    # first and last samples are always kept; the rest is split into n_out - 2 buckets
+    edges = (np.arange(n_out - 1) * ((n - 2) / (n_out - 2))).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # per-bucket means in one pass; the last bucket looks ahead to the final sample
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])[1:]
+    avg_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / counts, y[-1])[1:]
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        area = np.abs((x[a] - avg_x[i]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y[i] - y[a]))
+        a = lo + int(area.argmax())
+        selected[i + 1] = a
+
+    return selected
+
+
+def lttb_indices(times: np.ndarray, values: np.ndarray, n_out: int) -> np.ndarray:
+    """Return positions of the samples LTTB keeps, in time order.
+
+    Use this instead of `lttb_downsample` when other columns (day, labels)
+    must be carried along with the selected samples.
+    """
+    times = np.asarray(times)
+    values = np.asarray(values)
+    order = np.argsort(times, kind="stable")
+    if len(times) <= n_out:
+        return order
+    idx = _lttb_indices(_as_float(times[order]), values[order], n_out)
+    return order[idx]
+
+
+def lttb_downsample(times: np.ndarray, values: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a time series to at most `n_out` points with LTTB.
+
+    Largest-Triangle-Three-Buckets keeps the first and last sample and, per
+    bucket, the point spanning the largest triangle with its neighbours, so
+    peaks and dips survive while the point count drops to roughly the number
+    of pixels available. Inputs are sorted by time first; series that are
+    already small enough are returned unchanged.
+    """
+    times = np.asarray(times)
+    values = np.asarray(values)
+    if len(times) <= n_out:
+        return times, values
+
+    idx = lttb_indices(times, values, n_out)
+    return times[idx], values[idx]
+
+
+__all__ = ["lttb_downsample", "lttb_indices"]
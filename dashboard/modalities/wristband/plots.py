@@ -1,37 +1,43 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 
-from dashboard.config import WEARING_COLOR_MAP, WEARING_LABELS
+from dashboard.config import TIMELINE_MAX_POINTS, WEARING_COLOR_MAP, WEARING_LABELS
+from dashboard.modalities.wristband.downsample import lttb_indices
 
 
 def plot_wristband_stacked(hours_per_bin: pd.DataFrame) -> go.Figure:
-    figure = go.Figure()
-
-    for label in WEARING_LABELS[::-1]:
-        figure.add_trace(
-            go.Bar(
-                x=hours_per_bin["Day"],
-                y=hours_per_bin[label],
-                name=label,
-                marker_color=WEARING_COLOR_MAP[label],
-            )
+    bars = [
+        go.Bar(
+            x=hours_per_bin["Day"],
+            y=hours_per_bin[label],
+            name=label,
+            marker_color=WEARING_COLOR_MAP[label],
         )
-
-    figure.update_layout(
-        barmode="stack",
-        yaxis={"range": [0, 24]},
-        xaxis_title="Day",
-        yaxis_title="Hours",
-        title="Stacked Hours of Wearing Detection per Day",
-        height=420,
+        for label in WEARING_LABELS[::-1]
+    ]
+    return go.Figure(
+        data=bars,
+        layout=dict(
+            barmode="stack",
+            yaxis={"range": [0, 24]},
+            xaxis_title="Day",
+            yaxis_title="Hours",
+            title="Stacked Hours of Wearing Detection per Day",
+            height=420,
+        ),
     )
-    return figure
 
 
 def plot_wristband_timeline(df_all: pd.DataFrame, wear_col: str) -> go.Figure:
+    times = df_all["datetime"]
+    if times.dtype.kind == "M" and len(df_all) > TIMELINE_MAX_POINTS:
+        # LTTB keeps the visual envelope while bounding the marker count by the plot resolution
+        values = df_all[wear_col].to_numpy(dtype=np.float32)
+        df_all = df_all.iloc[np.sort(lttb_indices(times.to_numpy(dtype="datetime64[ns]"), values, TIMELINE_MAX_POINTS))]
     return px.scatter(
         df_all,
         x="datetime",
@@ -39,6 +45,7 @@ def plot_wristband_timeline(df_all: pd.DataFrame, wear_col: str) -> go.Figure:
         color="day_folder",
         labels={wear_col: "Wearing"},
         title="Wearing Detection Events (All Days)",
+        render_mode="webgl",
     )
 
 
@@ -2,13 +2,34 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
 from dashboard.config import WEARING_BINS, WEARING_LABELS
+from dashboard.modalities.timestamps import to_wall_clock
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # fall back to pandas' C parser
+    pa = pa_csv = None
 
 
 EMBRACEPLUS_DIR = "EmbracePlus"
 WEARING_FILE_HINT = "wearing-detection"
+WEARING_COLUMN = "wearing_detection_percentage"
+_WEAR_BIN_DTYPE = pd.CategoricalDtype(WEARING_LABELS, ordered=True)
+SAMPLE_PERIOD = pd.Timedelta(minutes=1)
+
+
+def _ensure_datetime(values: pd.Series) -> pd.Series:
+    """Return `values` as a naive datetime64 column in local wall-clock time.
+
+    ISO strings are parsed with each value's own UTC offset dropped (see
+    `to_wall_clock`), so days on both sides of a DST switch line up with the
+    sleep, meditation and subjective rows.
+    """
+    return to_wall_clock(values)
 
 
 def _parse_datetime(df: pd.DataFrame) -> pd.Series:
@@ -20,17 +41,46 @@ def _parse_datetime(df: pd.DataFrame) -> pd.Series:
     treats the rows as missing timestamps.
     """
     if "timestamp_iso" in df.columns:
-        return pd.to_datetime(df["timestamp_iso"], errors="coerce")
+        return _ensure_datetime(df["timestamp_iso"])
 
     # Strict ISO-only policy: do not attempt to convert unix timestamps here.
     return pd.Series(pd.NaT, index=df.index)
 
 
 def _find_wearing_col(columns: list[str]) -> str | None:
-    for column in columns:
-        if "wearing_detection_percentage" in column.lower():
-            return column
-    return None
+    # EmbracePlus writes the exact name; only scan for variants when it is missing
+    if WEARING_COLUMN in columns:
+        return WEARING_COLUMN
+    return next((column for column in columns if WEARING_COLUMN in column.lower()), None)
+
+
+def _wear_bin(values: pd.Series) -> pd.Series:
+    """Bin wearing percentages into the ordered WEARING_LABELS categories.
+
+    Same left-closed bins as `pd.cut(..., right=False)`, computed with one
+    binary search per value; missing and out-of-range values stay NaN.
+    """
+    vals = values.to_numpy(dtype=np.float64, na_value=np.nan)
+    edges = np.asarray(WEARING_BINS, dtype=np.float64)
+    codes = np.searchsorted(edges[1:-1], vals, side="right")
+    codes[np.isnan(vals) | (vals < edges[0]) | (vals >= edges[-1])] = -1
+    categorical = pd.Categorical.from_codes(codes, dtype=_WEAR_BIN_DTYPE)
+    return pd.Series(categorical, index=values.index, name=values.name)
+
+
+def _read_wearing_csv(path_str: str, day_folder: str) -> pd.DataFrame:
+    """Read one per-minute wearing-detection file with `day_folder` added."""
+    if pa_csv is not None:
+        # keep timestamp_iso as text: Arrow would otherwise parse it and drop the UTC offsets
+        convert_options = pa_csv.ConvertOptions(column_types={"timestamp_iso": pa.string()})
+        df = pa_csv.read_csv(path_str, convert_options=convert_options).to_pandas()
+    else:
+        df = pd.read_csv(path_str)
+    wear_col = _find_wearing_col(df.columns.tolist())
+    if wear_col is not None:
+        # percentages need no double precision; halves the largest column
+        df[wear_col] = df[wear_col].astype(np.float32)
+    return df.assign(day_folder=day_folder)
 
 
 def load_wearing_detection_data(participant_path: str | Path) -> tuple[pd.DataFrame, str | None]:
@@ -57,19 +107,25 @@ def load_wearing_detection_data(participant_path: str | Path) -> tuple[pd.DataFr
                     continue
 
                 try:
-                    df = pd.read_csv(csv_path)
+                    df = _read_wearing_csv(str(csv_path), day_dir.name)
                 except Exception:
                     continue
 
-                df["day_folder"] = day_dir.name
-                df["datetime"] = _parse_datetime(df)
                 frames.append(df)
 
     if not frames:
         return pd.DataFrame(), None
 
     df_wristband = pd.concat(frames, ignore_index=True)
+    # parse the timestamps of all files in one pass; offsets are dropped per value,
+    # so files on either side of a DST switch still parse to their local times
+    df_wristband["datetime"] = _parse_datetime(df_wristband)
+    # sort once here so views can rely on chronological order without re-sorting per rerun
+    df_wristband = df_wristband.sort_values("datetime", kind="stable", ignore_index=True)
     wear_col = _find_wearing_col(df_wristband.columns.tolist())
+    if wear_col is not None:
+        # bin once at load; the 1-byte categorical is reused by the per-bin summaries
+        df_wristband["wear_bin"] = _wear_bin(df_wristband[wear_col])
     return df_wristband, wear_col
 
 
@@ -78,9 +134,41 @@ def timeline_frame(df_wristband: pd.DataFrame, wear_col: str) -> pd.DataFrame:
     if df_wristband.empty or wear_col not in df_wristband.columns:
         return pd.DataFrame()
 
-    timeline_df = df_wristband[["datetime", "day_folder", wear_col]].dropna(subset=["datetime"]).copy()
-    timeline_df["timeline_y"] = 0
-    return timeline_df
+    timeline_df = df_wristband[["datetime", "day_folder", wear_col]].dropna(subset=["datetime"])
+    return timeline_df.assign(datetime=_ensure_datetime(timeline_df["datetime"]))
+
+
+def collapse_runs(df_wristband: pd.DataFrame, wear_col: str, bins: list[float] = WEARING_BINS) -> pd.DataFrame:
+    """Merge consecutive per-minute samples falling into the same wearing bin into spans.
+
+    A run ends when the bin changes, the day folder changes or consecutive
+    samples are more than one sample period apart, so recording gaps stay
+    visible. Returns one row per run with `start`, `stop` (end of the last
+    sample), `day_folder` and the mean wearing percentage in `wear_col`.
+    """
+    if df_wristband.empty or wear_col not in df_wristband.columns:
+        return pd.DataFrame(columns=["start", "stop", "day_folder", wear_col])
+
+    df = df_wristband[["datetime", "day_folder", wear_col]].dropna(subset=["datetime"]).sort_values("datetime")
+    values = df[wear_col].to_numpy(dtype=np.float64)
+    # same breakpoints as pd.cut(..., right=False); missing values form their own runs
+    bin_id = np.searchsorted(np.asarray(bins[1:-1], dtype=np.float64), values, side="right")
+    bin_id[np.isnan(values)] = -1
+
+    new_run = np.ones(len(df), dtype=bool)
+    new_run[1:] = (
+        (bin_id[1:] != bin_id[:-1])
+        | (df["day_folder"].to_numpy()[1:] != df["day_folder"].to_numpy()[:-1])
+        | (df["datetime"].diff().iloc[1:] > SAMPLE_PERIOD).to_numpy()
+    )
+    runs = (
+        df.groupby(np.cumsum(new_run), sort=False)
+        .agg(start=("datetime", "first"), stop=("datetime", "last"), day_folder=("day_folder", "first"), wear=(wear_col, "mean"))
+        .rename(columns={"wear": wear_col})
+        .reset_index(drop=True)
+    )
+    runs["stop"] = runs["stop"] + SAMPLE_PERIOD
+    return runs
 
 
 def hours_per_bin_table(df_wristband: pd.DataFrame, wear_col: str) -> pd.DataFrame:
@@ -88,33 +176,22 @@ def hours_per_bin_table(df_wristband: pd.DataFrame, wear_col: str) -> pd.DataFra
     if df_wristband.empty or wear_col not in df_wristband.columns:
         return pd.DataFrame()
 
-    df = df_wristband.dropna(subset=["datetime"]).copy()
+    df = df_wristband.dropna(subset=["datetime"])
     if df.empty:
         return pd.DataFrame()
 
-    df["minute"] = df["datetime"].dt.floor("min")
-    df["wearing_bin"] = pd.cut(
-        df[wear_col],
-        bins=WEARING_BINS,
-        labels=WEARING_LABELS,
-        include_lowest=True,
-        right=False,
-    )
-
-    minutes_per_bin = (
-        df.groupby(["day_folder", "wearing_bin"], observed=False)["minute"]
-        .nunique()
-        .reset_index(name="Minutes")
-    )
+    # minute buckets straight from the datetime64 values; no column is added to the frame
+    minutes = pd.Series(df["datetime"].to_numpy(dtype="datetime64[ns]").astype("datetime64[m]"), index=df.index)
+    wear_bins = df["wear_bin"] if "wear_bin" in df.columns else _wear_bin(df[wear_col])
 
+    # only days present in the frame; every wearing bin becomes a column via the reindex
+    minutes_per_bin = minutes.groupby([df["day_folder"], wear_bins], observed=True).nunique()
     hours_per_bin = (
-        minutes_per_bin.pivot(index="day_folder", columns="wearing_bin", values="Minutes")
-        .fillna(0)
+        minutes_per_bin.unstack(fill_value=0)
+        .reindex(columns=WEARING_LABELS, fill_value=0)
         .divide(60)
-        .reindex(WEARING_LABELS, axis=1)
-        .fillna(0)
+        .rename_axis(index="Day", columns="wearing_bin")
         .reset_index()
-        .rename(columns={"day_folder": "Day"})
     )
 
     return hours_per_bin
@@ -140,7 +217,7 @@ def summarize_wristband_recordings(df_wristband: pd.DataFrame, wear_col: str | N
     if df_wristband.empty:
         return 0, 1.0
 
-    valid = df_wristband.dropna(subset=["datetime"]).copy()
+    valid = df_wristband.dropna(subset=["datetime"])
     if valid.empty:
         return 0, 0.0
 
@@ -1,369 +1,350 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
-from plotly.subplots import make_subplots
 
-from dashboard.modalities.wristband.processing import timeline_frame
-from dashboard.services.data_quality import wristband_days_with_following_sleep_night, nights_with_following_wristband_day, night_day_summary_table
+from dashboard.config import WEARING_BINS, WEARING_COLOR_MAP, WEARING_LABELS
+from dashboard.modalities.wristband.processing import collapse_runs
+from dashboard.services.data_loader import get_timeline_frame
+from dashboard.services.data_quality import night_day_summary_table
 
 def row_center_y(row_heights: list[float], row_index: int) -> float:
     return 1.0 - (sum(row_heights[:row_index]) + row_heights[row_index] / 2.0)
 
 
-def build_combined_overview(df_all: pd.DataFrame, wear_col: str | None, df_sleep: pd.DataFrame, df_meditation: pd.DataFrame, df_subjective: pd.DataFrame) -> go.Figure | None:
-    """Return stacked timeline combining wristband wearing and sleep intervals."""
+# Wristband runs are colored by bin code (index into WEARING_LABELS, missing values last)
+# through a stepped colorscale, so the figure ships one uint8 per run instead of a CSS string
+_WEAR_BIN_EDGES = np.asarray(WEARING_BINS[1:-1], dtype=np.float32)
+_WEAR_MISSING_CODE = len(WEARING_LABELS)
+_WEAR_COLORSCALE = [
+    [(code + edge) / (_WEAR_MISSING_CODE + 1), color]
+    for code, color in enumerate([WEARING_COLOR_MAP[label] for label in WEARING_LABELS] + ["#cccccc"])
+    for edge in (0, 1)
+]
+
+
+def _wear_bin_codes(vals: np.ndarray) -> np.ndarray:
+    """Map wearing percentages to uint8 bin codes using the WEARING_BINS breakpoints."""
+    vals = np.asarray(vals, dtype=np.float32)
+    codes = np.searchsorted(_WEAR_BIN_EDGES, vals, side="right").astype(np.uint8)
+    codes[np.isnan(vals)] = _WEAR_MISSING_CODE
+    return codes
+
+
+# Fixed 4-row layout (each takes a quarter of the figure):
+# 1: Subjective, 2: Meditation, 3: Sleep, 4: Wristband
+_ROW_HEIGHTS = [0.25, 0.25, 0.25, 0.25]
+# paper y of each row's center, top to bottom
+_ROW_CENTERS = tuple(row_center_y(_ROW_HEIGHTS, i) for i in range(len(_ROW_HEIGHTS)))
+
+
+def _axis_suffix(row: int) -> str:
+    """Return the Plotly axis id suffix of subplot `row` ("" for the first, "2" for the second, ...)."""
+    return "" if row == 1 else str(row)
+
+
+def _stacked_axes_layout(row_heights: list[float]) -> dict:
+    """Return the axes of a one-column stack sharing its x axis, as make_subplots would wire them.
+
+    Rows touch (no vertical spacing) and every x axis follows the bottom one,
+    which is the only one showing tick labels.
+    """
+    layout: dict = {}
+    top = 1.0
+    for row, height in enumerate(row_heights, start=1):
+        suffix = _axis_suffix(row)
+        xaxis = dict(anchor=f"y{suffix}", domain=[0.0, 1.0])
+        if row < len(row_heights):
+            xaxis.update(matches=f"x{len(row_heights)}", showticklabels=False)
+        layout[f"xaxis{suffix}"] = xaxis
+        layout[f"yaxis{suffix}"] = dict(anchor=f"x{suffix}", domain=[top - height, top])
+        top -= height
+    return layout
+
+
+# built once; make_subplots recomputes this grid and its bookkeeping for every figure
+_STACKED_AXES = _stacked_axes_layout(_ROW_HEIGHTS)
+# sleep/meditation bar thickness in row units (y range [-0.5, 0.5]): 5% of the figure height
+_INTERVAL_BAR_WIDTH = 0.05 / _ROW_HEIGHTS[1]
+
+
+def _legend_entry(y: float, color: str, text: str) -> tuple[dict, dict]:
+    """Return the dot swatch and label annotations of one legend entry right of the plot."""
+    swatch = dict(
+        xref="paper",
+        yref="paper",
+        x=1.01,
+        y=y,
+        xanchor="center",
+        yanchor="middle",
+        showarrow=False,
+        text="●",
+        font=dict(size=18, color=color),
+    )
+    label = dict(
+        xref="paper",
+        yref="paper",
+        x=1.03,
+        y=y,
+        xanchor="left",
+        yanchor="middle",
+        showarrow=False,
+        text=text,
+        font=dict(size=11, color="#333"),
+    )
+    return swatch, label
+
+
+# Subjective section colors (brown shades for diaries, orange shades for TET ratings)
+_SECTION_COLOR_MAP = {
+    "sleep_diary": "#854515",
+    "activity_diary": "#A3651F",
+    "tet_diary": "#DF6304",
+    "tet_meditation": "#FF8827",
+}
+
+# Annotations that only depend on the fixed row layout are built once at import
+_MEDITATION_LEGEND = _legend_entry(_ROW_CENTERS[1], "#6cb5e9", "Meditation")
+# wearing-bin swatches stacked around the wristband row center
+_WRISTBAND_LEGEND = tuple(
+    annotation
+    for i, label in enumerate(WEARING_LABELS[::-1])
+    for annotation in _legend_entry(
+        _ROW_CENTERS[3] + ((len(WEARING_LABELS) - 1) / 2 - i) * 0.035,
+        WEARING_COLOR_MAP[label],
+        f"Wearing {label}",
+    )
+)
+# left-side subplot titles (centered vertically at each row)
+_ROW_TITLES = tuple(
+    dict(
+        xref="paper",
+        yref="paper",
+        x=0,
+        xshift=-20,
+        y=_ROW_CENTERS[idx],
+        xanchor="right",
+        yanchor="middle",
+        showarrow=False,
+        text=f"<b>{title}</b>",
+        font=dict(size=12, color="#111"),
+    )
+    for idx, title in enumerate(["Subjective", "Meditation EEG", "Sleep EEG", "Wristband"])
+)
+
+
+def _plot_datetimes(values: pd.Series) -> np.ndarray:
+    """Return timestamps as a numpy array Plotly can ship without per-point parsing.
+
+    Plotly renders wall-clock times and ignores UTC offsets, so tz-aware
+    columns are converted to naive local time rather than to UTC.
+    """
+    if isinstance(values.dtype, pd.DatetimeTZDtype):
+        values = values.dt.tz_localize(None)
+    if values.dtype.kind == "M":
+        return values.to_numpy(dtype="datetime64[ns]")
+    return values.to_numpy()
+
+
+def _to_dt(values: pd.Series) -> pd.Series:
+    """Return `values` as datetimes, parsing only columns the cached loaders did not already parse.
+
+    No UTC conversion: the overview plots wall-clock times (see `_plot_datetimes`).
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, errors="coerce")
+
+
+def _day_strings(columns: list[pd.Series]) -> list[str]:
+    """Return the sorted distinct wall-clock dates ("YYYY-MM-DD") found in datetime columns."""
+    days = [_plot_datetimes(col).astype("datetime64[D]") for col in columns if len(col)]
+    if not days:
+        return []
+    days = np.concatenate(days)
+    return np.datetime_as_string(np.unique(days[~np.isnat(days)]), unit="D").tolist()
+
+
+def _interval_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the rows of a sleep/meditation frame with parseable start and stop, sorted by start."""
+    if df.empty:
+        return pd.DataFrame()
+    starts = _to_dt(df["start"])
+    stops = _to_dt(df["stop"])
+    valid = (starts.notna() & stops.notna()).to_numpy()
+    return df[valid].assign(start=starts[valid], stop=stops[valid]).sort_values("start")
+
+
+def _add_interval_row(fig: go.Figure, intervals: pd.DataFrame, row: int, color: str, id_col: str, id_label: str) -> None:
+    """Draw sleep nights or meditation sessions as one horizontal bar trace in subplot `row`.
+
+    `intervals` comes from `_interval_frame`; `id_col` names the column shown
+    in the hover text as `id_label` (e.g. "night" as "Night").
+    """
+    starts = intervals["start"]
+    stops = intervals["stop"]
+    ids = intervals[id_col].astype(str).to_numpy() if id_col in intervals.columns else np.full(len(starts), "")
+    start_iso = starts.dt.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    stop_iso = stops.dt.strftime("%Y-%m-%dT%H:%M:%S").to_numpy()
+    hover_text = [f"Start: {start}<br>Stop: {stop}<br>{id_label}: {i}" for start, stop, i in zip(start_iso, stop_iso, ids)]
+
+    bases = _plot_datetimes(starts)
+    fig.add_trace(
+        go.Bar(
+            base=bases,
+            x=((_plot_datetimes(stops) - bases) / np.timedelta64(1, "ms")).astype(np.float32),
+            y=np.zeros(len(bases), dtype=np.float32),
+            orientation="h",
+            width=_INTERVAL_BAR_WIDTH,
+            marker=dict(color=color, line=dict(width=0)),
+            hoverinfo="text",
+            hovertext=hover_text,
+            showlegend=False,
+            xaxis=f"x{_axis_suffix(row)}",
+            yaxis=f"y{_axis_suffix(row)}",
+        )
+    )
+    fig.update_layout({f"yaxis{_axis_suffix(row)}": dict(visible=False, range=[-0.5, 0.5])})
+
+
+# reruns for the same participant data (widget clicks, tab switches) reuse the finished figure;
+# the cache is keyed on `source_key`, the `_`-prefixed frames are not hashed by Streamlit
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_combined_overview(source_key: tuple[str, int], _df_all: pd.DataFrame, wear_col: str | None, _df_sleep: pd.DataFrame, _df_meditation: pd.DataFrame, _df_subjective: pd.DataFrame) -> go.Figure | None:
+    """Return stacked timeline of subjective entries, meditation and sleep EEG intervals and wristband wearing.
+
+    `source_key` is the (participant path, mtime_ns) the frames were loaded
+    for (`ParticipantBundle.source_key`). Returns None when none of the four
+    inputs has plottable rows.
+    """
+    # nothing to plot: skip all parsing and layout work
+    if (_df_all.empty or wear_col is None) and _df_sleep.empty and _df_meditation.empty and _df_subjective.empty:
+        return None
+
     timeline_df = pd.DataFrame()
-    if wear_col is not None and not df_all.empty:
-        timeline_df = timeline_frame(df_all, wear_col)
+    if wear_col is not None and not _df_all.empty:
+        timeline_df = get_timeline_frame(source_key, _df_all, wear_col)
 
     #################################### Setting up dataframes for sleep, meditation, and wristband
-    sleep_df = pd.DataFrame()
-    if not df_sleep.empty:
-        sleep_df = df_sleep.dropna(subset=["start", "stop"]).copy()
-        if not sleep_df.empty:
-            sleep_df["start"] = pd.to_datetime(sleep_df["start"], errors="coerce")
-            sleep_df["stop"] = pd.to_datetime(sleep_df["stop"], errors="coerce")
-            sleep_df.sort_values("start", inplace=True)
-        
-    meditation_df = pd.DataFrame() 
-    if not df_meditation.empty:
-        meditation_df = df_meditation.dropna(subset=["start", "stop"]).copy()
-        if not meditation_df.empty:
-            meditation_df["start"] = pd.to_datetime(meditation_df["start"], errors="coerce")
-            meditation_df["stop"] = pd.to_datetime(meditation_df["stop"], errors="coerce")
-            meditation_df.sort_values("start", inplace=True)
-
-    # Build a fixed 4-row layout (each takes a quarter of the figure):
-    # 1: Subjective, 2: Meditation, 3: Sleep, 4: Wristband
-    rows = 4
-    row_heights = [0.25, 0.25, 0.25, 0.25]
-    fig = make_subplots(
-        rows=rows,
-        cols=1,
-        shared_xaxes=True,
-        row_heights=row_heights,
-        vertical_spacing=-0,
-    )
+    sleep_df = _interval_frame(_df_sleep)
+    meditation_df = _interval_frame(_df_meditation)
+    sdf_subjective = pd.DataFrame()
+    if not _df_subjective.empty:
+        sdf_subjective = _df_subjective.dropna(subset=["recording_date"])
 
     # flags for which data are present (used later)
     has_sleep = not sleep_df.empty
     has_meditation = not meditation_df.empty
     has_wrist = not timeline_df.empty if isinstance(timeline_df, pd.DataFrame) else False
 
+    # inputs that were non-empty but held no usable rows: still nothing to plot
+    if not (has_wrist or has_sleep or has_meditation or not sdf_subjective.empty):
+        return None
+
+    rows = 4
+    fig = go.Figure(layout=_STACKED_AXES)
+    # background shapes, legend and title annotations are collected and assigned to the layout in one call
+    all_shapes: list[dict] = []
+    annotations: list[dict] = []
+
     ################################## Subjective data processing
     # Subjective row (row 1)
     current_row = 1
-    sdf_subjective = pd.DataFrame()
-    if not df_subjective.empty:
-        sdf_subjective = df_subjective.dropna(subset=["recording_date"]).copy()
     if not sdf_subjective.empty:
-        sdf = sdf_subjective.copy()
-        sdf["recording_date"] = pd.to_datetime(sdf["recording_date"], errors="coerce")
-        sdf.sort_values("recording_date", inplace=True)
-
-        # color mapping consistent with subjective plots
-        brown_shades = ["#854515", "#A3651F"]
-        orange_shades = ["#DF6304", "#FF8827"]
-        color_map = {
-            "sleep_diary": brown_shades[0],
-            "activity_diary": brown_shades[1],
-            "tet_diary": orange_shades[0],
-            "tet_meditation": orange_shades[1],
-        }
-        # determine present sections in order of appearance
+        sdf = sdf_subjective.assign(recording_date=_to_dt(sdf_subjective["recording_date"])).sort_values("recording_date")
+
+        # determine present sections in order of appearance; the factorize codes index them per row
         present_sections: list[str] = []
-        for sec in sdf.get("section", []):
-            sec_label = str(sec) if not pd.isna(sec) else "unknown"
-            if sec_label in present_sections:
-                continue
-            present_sections.append(sec_label)
+        if "section" in sdf.columns:
+            section_codes, uniques = pd.factorize(sdf["section"].fillna("unknown").astype(str))
+            present_sections = uniques.tolist()
 
-        # draw one horizontal marker trace per present section, stacked within the subjective row
+        # one marker trace for all sections, colored and stacked within the subjective row per section
         n_pres = len(present_sections)
-        base_y = row_center_y(row_heights, 0)
+        base_y = _ROW_CENTERS[0]
         dy = 0.04 if n_pres <= 4 else 0.03
-        for idx, sec_label in enumerate(present_sections):
-            # pick color
-            color = color_map.get(sec_label, "grey")
-            # select rows matching this section (handle NaN as 'unknown')
-            if sec_label == "unknown":
-                sdf_sec = sdf[pd.isna(sdf.get("section"))].copy()
-            else:
-                sdf_sec = sdf[sdf.get("section") == sec_label].copy()
-            if sdf_sec.empty:
-                continue
-            y_pos = base_y + (idx - (n_pres - 1) / 2) * dy
+        if present_sections:
+            section_labels = np.asarray(present_sections, dtype=object)
+            section_colors = np.asarray([_SECTION_COLOR_MAP.get(sec_label, "grey") for sec_label in present_sections], dtype=object)
             fig.add_trace(
                 go.Scatter(
-                    x=sdf_sec["recording_date"],
-                    y=[y_pos] * len(sdf_sec),
+                    x=sdf["recording_date"],
+                    y=(base_y + (section_codes - (n_pres - 1) / 2) * dy).astype(np.float32),
                     mode="markers",
-                    marker=dict(color=color, size=8),
-                    hovertemplate=(
-                        f"{sec_label}<br>Recording Date: %{{x|%Y-%m-%d %H:%M}}<extra></extra>"
-                    ),
-                    name=sec_label,
+                    marker=dict(color=section_colors[section_codes], size=8),
+                    customdata=section_labels[section_codes],
+                    hovertemplate="%{customdata}<br>Recording Date: %{x|%Y-%m-%d %H:%M}<extra></extra>",
+                    name="Subjective",
                     showlegend=False,
-                ),
-                row=current_row,
-                col=1,
+                    xaxis="x",
+                    yaxis="y",
+                )
             )
 
-        # Create legend proxy shapes+annotations per unique section so legend colors match markers
-        n = len(present_sections)
-        if n:
-            dy_legend = 0.04
-            for i, sec_label in enumerate(present_sections):
-                color = color_map.get(sec_label, "grey")
-                y_center = base_y + (i - (n - 1) / 2) * dy_legend
-                # draw a true circle in paper coordinates (equal width and height)
-                center_x = 1.01
-                half = 0.005
-                # use a Unicode dot annotation as a swatch so it's rendered as a perfect circle
-                fig.add_annotation(
-                    dict(
-                        xref="paper",
-                        yref="paper",
-                        x=1.01,
-                        y=y_center,
-                        xanchor="center",
-                        yanchor="middle",
-                        showarrow=False,
-                        text="●",
-                        font=dict(size=18, color=color),
-                    )
-                )
-                fig.add_annotation(
-                    dict(
-                        xref="paper",
-                        yref="paper",
-                        x=1.03,
-                        y=y_center,
-                        xanchor="left",
-                        yanchor="middle",
-                        showarrow=False,
-                        text=sec_label,
-                        font=dict(size=11, color="#333"),
-                    )
-                )
+        # Create legend proxy annotations per unique section so legend colors match markers
+        dy_legend = 0.04
+        for i, sec_label in enumerate(present_sections):
+            y_center = base_y + (i - (n_pres - 1) / 2) * dy_legend
+            annotations.extend(_legend_entry(y_center, _SECTION_COLOR_MAP.get(sec_label, "grey"), sec_label))
 
-        fig.update_yaxes(visible=False, row=current_row, col=1)
         # wristband label intentionally removed
-    else:
-        fig.update_yaxes(visible=False, row=current_row, col=1)
+    fig.update_layout(yaxis=dict(visible=False))
     current_row += 1
 
     # Meditation (row 2)
     if not meditation_df.empty:
-        mdf = meditation_df.copy()
-        m_shapes: list[dict] = []
-        m_hover_x: list[pd.Timestamp] = []
-        m_hover_text: list[str] = []
-        for _, mrow in mdf.iterrows():
-            mstart = mrow["start"]
-            mstop = mrow["stop"]
-            if pd.isna(mstart) or pd.isna(mstop):
-                continue
-            m_shapes.append(
-                dict(
-                    type="rect",
-                    xref="x",
-                    x0=mstart,
-                    x1=mstop,
-                    yref="paper",
-                    y0=row_center_y(row_heights, 1) - 0.025,
-                    y1=row_center_y(row_heights, 1) + 0.025,
-                    fillcolor="#6cb5e9",
-                    line=dict(width=0),
-                )
-            )
-            mid = mstart + (mstop - mstart) / 2
-            m_hover_x.append(mid)
-            try:
-                s_iso = pd.to_datetime(mstart).isoformat()
-                e_iso = pd.to_datetime(mstop).isoformat()
-            except Exception:
-                s_iso = str(mstart)
-                e_iso = str(mstop)
-            m_hover_text.append(f"Start: {s_iso}<br>Stop: {e_iso}<br>Session: {mrow.get('session','')}")
-        for sh in m_shapes:
-            fig.add_shape(sh)
-        if m_hover_x:
-            fig.add_trace(
-                go.Scatter(
-                    x=m_hover_x,
-                    y=[row_center_y(row_heights, 1)] * len(m_hover_x),
-                    mode="markers",
-                    marker=dict(opacity=0, size=20),
-                    hoverinfo="text",
-                    hovertext=m_hover_text,
-                    showlegend=False,
-                ),
-                row=current_row,
-                col=1,
-            )
-
+        _add_interval_row(fig, meditation_df, current_row, "#6cb5e9", "session", "Session")
 
         # Add a small legend swatch centered on the meditation subplot
-        y_med = row_center_y(row_heights, 1)
-        # meditation legend swatch (dot glyph)
-        fig.add_annotation(
-            dict(
-                xref="paper",
-                yref="paper",
-                x=1.01,
-                y=y_med,
-                xanchor="center",
-                yanchor="middle",
-                showarrow=False,
-                text="●",
-                font=dict(size=18, color="#6cb5e9"),
-            )
-        )
-        fig.add_annotation(
-            dict(
-                xref="paper",
-                yref="paper",
-                x=1.03,
-                y=y_med,
-                xanchor="left",
-                yanchor="middle",
-                showarrow=False,
-                text="Meditation",
-                font=dict(size=11, color="#333"),
-            )
-        )
-
-        fig.update_yaxes(visible=False, row=current_row, col=1)
+        annotations.extend(_MEDITATION_LEGEND)
     current_row += 1
 
     ################################# Sleep data processing (row 3)
     if not sleep_df.empty:
-        sdf = sleep_df.copy()
-        shapes: list[dict] = []
-        hover_x: list[pd.Timestamp] = []
-        hover_text: list[str] = []
-        for _, row in sdf.iterrows():
-            start = row["start"]
-            stop = row["stop"]
-            if pd.isna(start) or pd.isna(stop):
-                continue
-
-            shapes.append(
-                dict(
-                    type="rect",
-                    xref="x",
-                    x0=start,
-                    x1=stop,
-                    yref="paper",
-                    y0=row_center_y(row_heights, 2) - 0.025,
-                    y1=row_center_y(row_heights, 2) + 0.025,
-                    fillcolor="#1f77b4",
-                    line=dict(width=0),
-                )
-            )
-
-            mid = start + (stop - start) / 2
-            hover_x.append(mid)
-            try:
-                start_iso = pd.to_datetime(start).isoformat()
-                stop_iso = pd.to_datetime(stop).isoformat()
-            except Exception:
-                start_iso = str(start)
-                stop_iso = str(stop)
-
-            hover_text.append(f"Start: {start_iso}<br>Stop: {stop_iso}<br>Night: {row.get('night','')}")
-
-        for shape in shapes:
-            fig.add_shape(shape)
-
-        if hover_x:
-            fig.add_trace(
-                go.Scatter(
-                    x=hover_x,
-                    y=[row_center_y(row_heights, 2)] * len(hover_x),
-                    mode="markers",
-                    marker=dict(opacity=0, size=20),
-                    hoverinfo="text",
-                    hovertext=hover_text,
-                    showlegend=False,
-                ),
-                row=current_row,
-                col=1,
-            )
-
-        # Add a small legend swatch centered on the sleep subplot
-        y_sleep = row_center_y(row_heights, 2)
-        # sleep legend swatch (dot glyph)
-        fig.add_annotation(
-            dict(
-                xref="paper",
-                yref="paper",
-                x=1.01,
-                y=y_sleep,
-                xanchor="center",
-                yanchor="middle",
-                showarrow=False,
-                text="●",
-                font=dict(size=18, color="#1f77b4"),
-            )
-        )
-        fig.add_annotation(
-            dict(
-                xref="paper",
-                yref="paper",
-                x=1.03,
-                y=y_sleep,
-                xanchor="left",
-                yanchor="middle",
-                showarrow=False,
-                # combine sleep with company label as text if available
-                text=f"Sleep ({sleep_df['company'].iloc[0]})" if 'company' in sleep_df.columns else "Fail",
-                font=dict(size=11, color="#333"),
-            )
-        )
+        _add_interval_row(fig, sleep_df, current_row, "#1f77b4", "night", "Night")
 
-        fig.update_yaxes(visible=False, row=current_row, col=1)
+        # Add a small legend swatch centered on the sleep subplot, labelled with the EEG company if available
+        companies = sleep_df["company"].dropna().unique() if "company" in sleep_df.columns else []
+        sleep_label = f"Sleep ({', '.join(map(str, companies))})" if len(companies) else "Sleep"
+        annotations.extend(_legend_entry(_ROW_CENTERS[2], "#1f77b4", sleep_label))
 
     ################################# Wristband data processing (row 4)
     current_row += 1
     if has_wrist:
+        # one horizontal bar per run of same-bin minutes instead of one marker per sample
+        wear_runs = collapse_runs(timeline_df, wear_col)
+        run_starts = _plot_datetimes(wear_runs["start"])
+        run_ms = ((_plot_datetimes(wear_runs["stop"]) - run_starts) / np.timedelta64(1, "ms")).astype(np.float32)
+        run_values = wear_runs[wear_col].to_numpy(dtype=np.float32)
         fig.add_trace(
-            go.Scatter(
-                x=timeline_df["datetime"],
-                y=[row_center_y(row_heights, 3)] * len(timeline_df),
-                mode="markers",
+            go.Bar(
+                base=run_starts,
+                x=run_ms,
+                y=np.zeros(len(wear_runs), dtype=np.float32),
+                orientation="h",
+                width=0.6,
                 marker=dict(
-                    size=10,
-                    color=timeline_df[wear_col],
-                    colorscale=["#ff4136", "#ffe066", "#b6e63e", "#2ecc40"],
-                    cmin=0,
-                    cmax=100,
-                    colorbar=dict(
-                        title="Wearing %",
-                        thickness=10,
-                        len=0.2,
-                        y=0.1,
-                        yanchor="middle",
-                        x=1.02,
-                        xanchor="left",
-                        tickmode="array",
-                        tickvals=[0, 100],
-                        ticktext=["0%", "100%"],
-                        tickfont=dict(size=10),
-                    ),
-                    showscale=True,
+                    color=_wear_bin_codes(run_values),
+                    colorscale=_WEAR_COLORSCALE,
+                    cmin=-0.5,
+                    cmax=_WEAR_MISSING_CODE + 0.5,
+                    showscale=False,
+                    line=dict(width=0),
                 ),
+                customdata=run_values,
                 name="Wristband",
-                hovertemplate="Time: %{x|%Y-%m-%d %H:%M}<br>Wearing: %{marker.color:.0f}%<extra></extra>",
+                hovertemplate="Start: %{base|%Y-%m-%d %H:%M}<br>Wearing: %{customdata:.0f}%<extra></extra>",
                 showlegend=False,
-            ),
-            row=current_row,
-            col=1,
+                xaxis=f"x{_axis_suffix(current_row)}",
+                yaxis=f"y{_axis_suffix(current_row)}",
+            )
         )
-        fig.update_yaxes(visible=False, row=current_row, col=1)
+
+        # Legend swatches for the wearing bins, stacked around the wristband row center
+        annotations.extend(_WRISTBAND_LEGEND)
+        fig.update_layout({f"yaxis{_axis_suffix(current_row)}": dict(visible=False, range=[-0.5, 0.5])})
 
     ################################# Layout update
     fig.update_layout(
@@ -372,135 +353,87 @@ def build_combined_overview(df_all: pd.DataFrame, wear_col: str | None, df_sleep
         margin={"l": 120, "r": 120, "t": 30, "b": 40},
         hovermode="closest",
         hoverdistance=8,
+        spikedistance=0,
         showlegend=True,
         legend=dict(orientation="v", x=1.02, y=0.95),
     )
 
-    fig.update_xaxes(title_text="Time", row=(rows or 1), col=1)
+    fig.update_layout({f"xaxis{_axis_suffix(rows)}": dict(title_text="Time")})
 
-    base_times = None
+    # x range straight from the column reductions (interval rows are already valid)
+    tmin = tmax = pd.NaT
     if has_wrist:
-        base_times = sorted(timeline_df["datetime"].dropna().unique().tolist())
+        # the timeline column is already parsed; read it once for the range and the day ticks
+        wrist_times = timeline_df["datetime"]
+        tmin, tmax = wrist_times.min(), wrist_times.max()
     elif has_sleep:
-        starts = sleep_df["start"].dropna().tolist()
-        stops = sleep_df["stop"].dropna().tolist()
-        if starts or stops:
-            base_times = [min(starts)] if starts else []
-            if stops:
-                base_times.append(max(stops))
-
-    if base_times:
-        tmin = min(base_times)
-        tmax = max(base_times)
-
-        # collect per-day ticks from available data (normalize to dates)
-        date_vals: list[pd.Timestamp] = []
-        try:
-            if has_wrist and not timeline_df.empty:
-                date_vals += pd.to_datetime(timeline_df["datetime"]).dt.normalize().dropna().unique().tolist()
-        except Exception:
-            pass
-        try:
-            if not sleep_df.empty:
-                date_vals += pd.to_datetime(sleep_df["start"]).dt.normalize().dropna().unique().tolist()
-                date_vals += pd.to_datetime(sleep_df["stop"]).dt.normalize().dropna().unique().tolist()
-        except Exception:
-            pass
-        try:
-            if not meditation_df.empty:
-                date_vals += pd.to_datetime(meditation_df["start"]).dt.normalize().dropna().unique().tolist()
-                date_vals += pd.to_datetime(meditation_df["stop"]).dt.normalize().dropna().unique().tolist()
-        except Exception:
-            pass
-        try:
-            if not df_subjective.empty and "recording_date" in df_subjective.columns:
-                date_vals += pd.to_datetime(df_subjective["recording_date"]).dt.normalize().dropna().unique().tolist()
-        except Exception:
-            pass
-
-        # build unique sorted tick list as date strings (normalize to UTC) to avoid tz-aware/naive comparisons
-        tick_dates = sorted({pd.to_datetime(d, utc=True).normalize().strftime("%Y-%m-%d") for d in date_vals})
+        tmin, tmax = sleep_df["start"].min(), sleep_df["stop"].max()
+
+    if pd.notna(tmin) and pd.notna(tmax):
+
+        # one tick per calendar day (wall-clock date, like the plotted times) found in any modality
+        tick_columns = [wrist_times] if has_wrist else []
+        tick_columns += [interval_df[col] for interval_df in (sleep_df, meditation_df) if not interval_df.empty for col in ("start", "stop")]
+        if not _df_subjective.empty and "recording_date" in _df_subjective.columns:
+            tick_columns.append(_to_dt(_df_subjective["recording_date"]))
+        tick_dates = _day_strings(tick_columns)
         if not tick_dates:
-            tick_dates = [pd.to_datetime(tmin, utc=True).normalize().strftime("%Y-%m-%d"), pd.to_datetime(tmax, utc=True).normalize().strftime("%Y-%m-%d")]
+            tick_dates = [tmin.strftime("%Y-%m-%d"), tmax.strftime("%Y-%m-%d")]
 
         # hide tick labels for all rows, then enable/display rotated labels on bottom row only
-        for r in range(1, rows + 1):
-            fig.update_xaxes(
-                showticklabels=False,
-                showgrid=True,
-                range=[tmin, tmax],
-                row=r,
-                col=1,
-                type="date",
-            )
-
-        # bottom row: show every day and rotate labels for readability
         fig.update_xaxes(
-            tickformat="%Y-%m-%d",
-            tickmode="array",
-            tickvals=tick_dates,
-            tickangle=45,
-            showticklabels=True,
-            row=rows,
-            col=1,
+            showticklabels=False,
+            showgrid=True,
+            range=[tmin, tmax],
             type="date",
         )
 
-        # Add alternating day background shading (light grey) across the entire plot area
-        try:
-            start_day = pd.to_datetime(tmin).normalize()
-            end_day = pd.to_datetime(tmax).normalize()
-            days = pd.date_range(start=start_day, end=end_day, freq="D")
-            for i, d in enumerate(days):
-                if i % 2 == 0:
-                    x0 = d.isoformat()
-                    x1 = (d + pd.Timedelta(days=1)).isoformat()
-                    fig.add_shape(
-                        dict(
-                            type="rect",
-                            xref="x",
-                            yref="paper",
-                            x0=x0,
-                            x1=x1,
-                            y0=0,
-                            y1=1,
-                            fillcolor="rgba(200,200,200,0.08)",
-                            line=dict(width=0),
-                            layer="below",
-                        )
-                    )
-        except Exception:
-            pass
+        # bottom row: show every day and rotate labels for readability
+        fig.update_layout(
+            {
+                f"xaxis{_axis_suffix(rows)}": dict(
+                    tickformat="%Y-%m-%d",
+                    tickmode="array",
+                    tickvals=tick_dates,
+                    tickangle=45,
+                    showticklabels=True,
+                    type="date",
+                )
+            }
+        )
+
+        # Add alternating day background shading (light grey) across the entire plot area:
+        # one path shape with a closed subpath per shaded wall-clock day instead of one rect each
+        first_day = np.datetime64(tmin.strftime("%Y-%m-%d"))
+        last_day = np.datetime64(tmax.strftime("%Y-%m-%d"))
+        shaded_days = np.arange(first_day, last_day + 1, 2)
+        day_x0 = np.datetime_as_string(shaded_days, unit="D")
+        day_x1 = np.datetime_as_string(shaded_days + 1, unit="D")
+        all_shapes.append(
+            dict(
+                type="path",
+                xref="x",
+                yref="paper",
+                path=" ".join(f"M{x0},0 H{x1} V1 H{x0} Z" for x0, x1 in zip(day_x0, day_x1)),
+                fillcolor="rgba(200,200,200,0.08)",
+                line=dict(width=0),
+                layer="below",
+            )
+        )
 
         # Add left-side subplot titles (centered vertically at each row)
-        try:
-            titles = ["Subjective", "Meditation EEG", "Sleep EEG", "Wristband"]
-            for idx, title in enumerate(titles):
-                y_pos = row_center_y(row_heights, idx)
-                fig.add_annotation(
-                    dict(
-                        xref="paper",
-                        yref="paper",
-                        x=0,
-                        xshift=-20,
-                        y=y_pos,
-                        xanchor="right",
-                        yanchor="middle",
-                        showarrow=False,
-                        text=f"<b>{title}</b>",
-                        font=dict(size=12, color="#111"),
-                    )
-                )
-        except Exception:
-            pass
+        annotations.extend(_ROW_TITLES)
 
+    # single layout assignment instead of re-validating the shapes tuple per add_shape call
+    fig.update_layout(shapes=all_shapes, annotations=annotations)
     return fig
 
 
-def render_overview_tab(df_wristband: pd.DataFrame, wear_col: str | None, df_sleep: pd.DataFrame, df_meditation: pd.DataFrame, df_subjective: pd.DataFrame) -> None:
+@st.fragment
+def render_overview_tab(source_key: tuple[str, int], df_wristband: pd.DataFrame, wear_col: str | None, df_sleep: pd.DataFrame, df_meditation: pd.DataFrame, df_subjective: pd.DataFrame) -> None:
     st.header("Data Overview")
     st.subheader("Combined Timeline: Wristband + Sleep + Meditation + Subjective")
-    combined = build_combined_overview(df_wristband, wear_col, df_sleep, df_meditation, df_subjective)
+    combined = build_combined_overview(source_key, df_wristband, wear_col, df_sleep, df_meditation, df_subjective)
     
     
     if combined:
@@ -6,6 +6,7 @@ import streamlit as st
 from dashboard.modalities.eeg.plots import plot_sleep_duration
 
 
+@st.fragment
 def render_sleep_tab(df_sleep: pd.DataFrame) -> None:
     st.header("🌙 Sleep Data")
 
@@ -3,7 +3,7 @@ from __future__ import annotations
 import pandas as pd
 
 from dashboard.data_access.participants import participant_path
-from dashboard.services.data_loader import get_meditation_data, get_sleep_reports, get_subjective_data, get_wristband_data
+from dashboard.services.data_loader import load_participant_bundle
 from dashboard.services.data_quality import nights_with_following_wristband_day, wristband_days_with_following_sleep_night
 from dashboard.modalities.eeg.processing import summarize_meditation_recordings, summarize_sleep_recordings
 from dashboard.modalities.wristband.processing import summarize_wristband_recordings
@@ -20,13 +20,13 @@ def _build_cohort_table(
 
     for pid in participants:
         p_dir = participant_path(data_base_path, pid)
-        df_wristband, wear_col = get_wristband_data(str(p_dir))
-        df_sleep = get_sleep_reports(str(p_dir))
-        df_meditation = get_meditation_data(str(p_dir))
-        df_subjective = get_subjective_data(str(p_dir))
+        bundle = load_participant_bundle(str(p_dir))
+        df_wristband, wear_col = bundle.df_wristband, bundle.wear_col
+        df_sleep, df_meditation, df_subjective = bundle.df_sleep, bundle.df_meditation, bundle.df_subjective
         wristband_days, wristband_total_hours = summarize_wristband_recordings(df_wristband, wear_col=wear_col)
         sleep_nights, sleep_total_hours = summarize_sleep_recordings(df_sleep)
         meditation_sessions, meditation_total_hours = summarize_meditation_recordings(df_meditation)
+        subjective_summary = summarize_subjective_data(df_subjective)
 
         nights_with_day, _ = nights_with_following_wristband_day(
             df_sleep, df_wristband, wear_col=wear_col, coverage_threshold=coverage_threshold
@@ -48,10 +48,10 @@ def _build_cohort_table(
                 "meditation_sessions": meditation_sessions,
                 "meditation_total_hours": meditation_total_hours,
                 "meditation_mean": meditation_total_hours / meditation_sessions if meditation_sessions > 0 else 0,
-                "sleep_diary_amount": summarize_subjective_data(df_subjective).get("sleep_diary_sheets_with_data", 0),
-                "tet_diary_amount": summarize_subjective_data(df_subjective).get("tet_diary_sheets_with_data", 0),
-                "activity_diary_amount": summarize_subjective_data(df_subjective).get("activity_diary_sheets_with_data", 0),
-                "tet_meditation_amount": summarize_subjective_data(df_subjective).get("tet_meditation_sheets_with_data", 0),
+                "sleep_diary_amount": subjective_summary.get("sleep_diary_sheets_with_data", 0),
+                "tet_diary_amount": subjective_summary.get("tet_diary_sheets_with_data", 0),
+                "activity_diary_amount": subjective_summary.get("activity_diary_sheets_with_data", 0),
+                "tet_meditation_amount": subjective_summary.get("tet_meditation_sheets_with_data", 0),
                 "nights_with_following_day": nights_with_day,
                 "days_with_following_night": days_with_night,
                 "coverage_threshold": coverage_threshold,
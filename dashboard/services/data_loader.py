@@ -1,29 +1,186 @@
 from __future__ import annotations
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
 import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
+from dashboard.data_access.participants import latest_mtime_ns, list_participants
+from dashboard.modalities.timestamps import to_wall_clock
 from dashboard.modalities.eeg.processing import load_meditation_reports, load_sleep_reports
-from dashboard.modalities.wristband.processing import load_wearing_detection_data
+from dashboard.modalities.wristband.processing import hours_per_bin_table, load_wearing_detection_data, timeline_frame
 from dashboard.modalities.subjective.processing import load_subjective_data
 
 
-@st.cache_data
-def get_wristband_data(path_str: str) -> tuple[pd.DataFrame, str | None]:
-    return load_wearing_detection_data(path_str)
+def _with_datetime_columns(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Return `df` with `columns` as naive local wall-clock datetime64.
+
+    Every report goes through `to_wall_clock`, whether it arrives parsed with
+    one UTC offset or as Timestamp objects with offsets that differ between
+    reports (a DST switch), so sleep and meditation share the wristband's
+    time convention and pages never re-parse the columns per render.
+    """
+    parsed = {col: to_wall_clock(df[col]) for col in columns if col in df.columns}
+    return df.assign(**parsed) if parsed else df
+
+
+def _with_label_categories(df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
+    """Return `df` with repetitive label columns stored as categoricals.
+
+    A column is converted only when it has fewer distinct values than half its
+    rows (e.g. one day folder per ~1440 wristband minutes); unique labels such
+    as night names stay strings.
+    """
+    converted = {
+        col: df[col].astype("category")
+        for col in columns
+        if col in df.columns and df[col].nunique() < len(df) / 2
+    }
+    return df.assign(**converted) if converted else df
+
+
+# Parsed wristband frames are also kept on disk so new sessions and server
+# restarts skip re-parsing the CSVs; see `_load_wristband_cached`. This is the
+# only persistent layer. Bump the version when the stored frame layout changes
+# (v2: wall-clock datetimes); the directory is capped at the most recently used files.
+_DISK_CACHE_DIR = Path.home() / ".cache" / "cam-lmu-asd"
+_DISK_CACHE_VERSION = 2
+_DISK_CACHE_MAX_FILES = 32
+
+
+def _prune_disk_cache(keep: Path) -> None:
+    """Delete every cached file except `keep` and the most recently used others."""
+    cached = sorted(_DISK_CACHE_DIR.glob("*.parquet"), key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    stale_prefix = keep.name.split("_", 1)[0] + "_"
+    survivors = 1
+    for path in cached:
+        if path == keep:
+            continue
+        # other versions/mtimes of the same participant are always stale
+        if path.name.startswith(stale_prefix) or survivors >= _DISK_CACHE_MAX_FILES:
+            path.unlink(missing_ok=True)
+        else:
+            survivors += 1
+
+
+def _load_wristband_cached(path_str: str, mtime_ns: int) -> tuple[pd.DataFrame, str | None]:
+    """Load wristband data through a Parquet copy keyed on (path, mtime_ns).
+
+    The wear column name travels in the frame's attrs. Any cache problem
+    (pyarrow missing, unwritable directory, corrupt file) falls back to the
+    CSV loader. Reads refresh the file's mtime so pruning evicts the least
+    recently used participants first.
+    """
+    key = hashlib.sha1(path_str.encode()).hexdigest()[:12]
+    cache_path = _DISK_CACHE_DIR / f"{key}_v{_DISK_CACHE_VERSION}_{mtime_ns}.parquet"
+    try:
+        df = pd.read_parquet(cache_path, engine="pyarrow")
+        os.utime(cache_path)
+        return df, df.attrs.get("wear_col")
+    except (ImportError, OSError, ValueError):
+        pass
+
+    df, wear_col = load_wearing_detection_data(path_str)
+    if df.empty:
+        return df, wear_col
+    try:
+        _DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.attrs["wear_col"] = wear_col
+        df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+        _prune_disk_cache(cache_path)
+    except (ImportError, OSError, ValueError):
+        pass
+    return df, wear_col
+
+
+@st.cache_data(ttl=60)
+def get_participants(data_base_path: str) -> list[str]:
+    return list_participants(data_base_path)
+
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_participant_mtime(path_str: str) -> int:
+    return latest_mtime_ns(path_str)
 
-@st.cache_data
-def get_sleep_reports(path_str: str) -> pd.DataFrame:
-    return load_sleep_reports(path_str, debug=False)
 
-@st.cache_data
-def get_meditation_data(path_str: str) -> pd.DataFrame:
-    return load_meditation_reports(path_str, debug=False)
+# Loaders are cached as shared resources: every rerun receives the same DataFrame
+# object instead of an unpickled copy, so callers must treat the frames as read-only
+# (copy-on-write, enabled in app.py, keeps derived views from writing through).
+# They are keyed on (path, mtime_ns) so edited or added files invalidate the entry.
+@st.cache_resource(max_entries=8)
+def get_wristband_data(path_str: str, mtime_ns: int) -> tuple[pd.DataFrame, str | None]:
+    df_wristband, wear_col = _load_wristband_cached(path_str, mtime_ns)
+    return _with_label_categories(df_wristband, ("day_folder",)), wear_col
 
-@st.cache_data
-def get_subjective_data(path_str: str) -> pd.DataFrame:
+
+@st.cache_resource(max_entries=8)
+def get_sleep_reports(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    df_sleep = _with_datetime_columns(load_sleep_reports(path_str, debug=False), ("start", "stop"))
+    return _with_label_categories(df_sleep, ("night", "file", "company"))
+
+@st.cache_resource(max_entries=8)
+def get_meditation_data(path_str: str, mtime_ns: int) -> pd.DataFrame:
+    df_meditation = _with_datetime_columns(load_meditation_reports(path_str, debug=False), ("start", "stop"))
+    return _with_label_categories(df_meditation, ("session", "file", "company"))
+
+@st.cache_resource(max_entries=8)
+def get_subjective_data(path_str: str, mtime_ns: int) -> pd.DataFrame:
     return load_subjective_data(path_str, debug=False)
 
 
-__all__ = ["get_wristband_data", "get_sleep_reports", "get_meditation_data", "get_subjective_data"]
+
+@dataclass(frozen=True)
+class ParticipantBundle:
+    """All modality frames of one participant, as returned by the cached loaders."""
+
+    df_wristband: pd.DataFrame
+    wear_col: str | None
+    df_sleep: pd.DataFrame
+    df_meditation: pd.DataFrame
+    df_subjective: pd.DataFrame
+    # (participant path, mtime_ns) the frames were loaded for; keys caches of views built from them
+    source_key: tuple[str, int]
+
+
+def load_participant_bundle(path_str: str) -> ParticipantBundle:
+    """Load wristband, sleep, meditation and subjective data for one participant.
+
+    Each modality lives in its own subfolder and its loader only scans that
+    subtree, so the four loaders run on a small thread pool instead of sharing
+    one walk over the participant folder. Warm reruns return the cached bundle
+    without touching the pool until a file below the folder changes.
+    """
+    return _load_participant_bundle(path_str, get_participant_mtime(path_str))
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _load_participant_bundle(path_str: str, mtime_ns: int) -> ParticipantBundle:
+    # worker threads need the script context so the cached loaders can run there
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=4, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        wristband = executor.submit(get_wristband_data, path_str, mtime_ns)
+        sleep = executor.submit(get_sleep_reports, path_str, mtime_ns)
+        meditation = executor.submit(get_meditation_data, path_str, mtime_ns)
+        subjective = executor.submit(get_subjective_data, path_str, mtime_ns)
+        df_wristband, wear_col = wristband.result()
+        return ParticipantBundle(df_wristband, wear_col, sleep.result(), meditation.result(), subjective.result(), (path_str, mtime_ns))
+
+
+# Derived wristband views, recomputed only when the participant's data changes. They
+# are cached on `source_key` (see ParticipantBundle); the `_`-prefixed frame is not hashed.
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_hours_per_bin_table(source_key: tuple[str, int], _df_wristband: pd.DataFrame, wear_col: str) -> pd.DataFrame:
+    return hours_per_bin_table(_df_wristband, wear_col)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_timeline_frame(source_key: tuple[str, int], _df_wristband: pd.DataFrame, wear_col: str) -> pd.DataFrame:
+    return timeline_frame(_df_wristband, wear_col)
+
+
+__all__ = ["get_participants", "get_wristband_data", "get_sleep_reports", "get_meditation_data", "get_subjective_data", "ParticipantBundle", "load_participant_bundle", "get_hours_per_bin_table", "get_timeline_frame"]
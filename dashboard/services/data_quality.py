@@ -2,16 +2,32 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
 import pandas as pd
 
+from dashboard.modalities.timestamps import to_wall_clock
 
-def _window_stats(minutes: pd.Series, start: pd.Timestamp, end: pd.Timestamp) -> tuple[int, int, float]:
+
+def _as_wall64(ts: pd.Timestamp) -> np.datetime64:
+	"""Return `ts` as a naive wall-clock datetime64, comparable with `_minute_series` output."""
+	ts = pd.Timestamp(ts)
+	if ts.tzinfo is not None:
+		ts = ts.tz_localize(None)
+	return ts.to_datetime64()
+
+
+def _observed_minutes(minutes: np.ndarray, start: pd.Timestamp, end: pd.Timestamp) -> int:
+	"""Count distinct data minutes in [start, end) with two binary searches."""
+	lo, hi = np.searchsorted(minutes, [_as_wall64(start), _as_wall64(end)], side="left")
+	return int(hi - lo)
+
+
+def _window_stats(minutes: np.ndarray, start: pd.Timestamp, end: pd.Timestamp) -> tuple[int, int, float]:
 	"""Return observed minutes, expected minutes, and coverage for [start, end)."""
 	if pd.isna(start) or pd.isna(end) or end <= start:
 		return 0, 0, 0.0
 
-	window_minutes = minutes[(minutes >= start) & (minutes < end)]
-	observed = int(window_minutes.nunique())
+	observed = _observed_minutes(minutes, start, end)
 	expected = int(math.ceil((end - start).total_seconds() / 60))
 	if expected <= 0:
 		return observed, expected, 0.0
@@ -33,26 +49,29 @@ def _sleep_windows(df_sleep: pd.DataFrame) -> pd.DataFrame:
 	return df[["night", "start", "stop"]]
 
 
-def _minute_series(df_wristband: pd.DataFrame, wear_col: str | None = None) -> pd.Series:
-	"""Return per-minute timestamps where wristband data exists (optionally with wear_col present)."""
+def _minute_series(df_wristband: pd.DataFrame, wear_col: str | None = None) -> np.ndarray:
+	"""Return the sorted distinct minutes (naive wall-clock datetime64[m]) where wristband data exists.
+
+	Optionally only minutes with `wear_col` present are kept. Window counts are
+	then two binary searches instead of a mask and nunique per window.
+	"""
 	if df_wristband.empty or "datetime" not in df_wristband.columns:
-		return pd.Series(dtype="datetime64[ns]")
+		return np.array([], dtype="datetime64[m]")
 
-	df = df_wristband.copy()
-	if wear_col and wear_col in df.columns:
-		df = df[df[wear_col].notna()]
+	times = df_wristband["datetime"]
+	if wear_col and wear_col in df_wristband.columns:
+		times = times[df_wristband[wear_col].notna()]
 
-	minutes = pd.to_datetime(df["datetime"], errors="coerce").dropna().dt.floor("min")
-	return minutes
+	times = to_wall_clock(times).dropna()
+	return np.unique(times.to_numpy(dtype="datetime64[ns]").astype("datetime64[m]"))
 
 
-def _coverage_between(minutes: pd.Series, start: pd.Timestamp, end: pd.Timestamp) -> float:
+def _coverage_between(minutes: np.ndarray, start: pd.Timestamp, end: pd.Timestamp) -> float:
 	"""Compute minute coverage between [start, end) as observed/expected."""
 	if pd.isna(start) or pd.isna(end) or end <= start:
 		return 0.0
 
-	window_minutes = minutes[(minutes >= start) & (minutes < end)]
-	observed = window_minutes.nunique()
+	observed = _observed_minutes(minutes, start, end)
 	expected = math.ceil((end - start).total_seconds() / 60)
 	if expected <= 0:
 		return 0.0
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from dashboard.modalities.subjective.processing import _is_blank, _sheet_tail
+
+
+@pytest.mark.parametrize("value", [None, float("nan"), "", "NA", "N/A", "n/a", "null", "NaN", "#N/A", " NA "])
+def test_is_blank_matches_read_excel_na_values(value):
+    assert _is_blank(value)
+
+
+@pytest.mark.parametrize("value", [" ", "x", "0", 0, 0.0, "not applicable"])
+def test_is_blank_keeps_data(value):
+    assert not _is_blank(value)
+
+
+def _write_sheet(path, rows):
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "TET"
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+
+
+@pytest.mark.parametrize("reader", ["calamine", "openpyxl"])
+def test_sheet_tail_skips_na_marker_rows(tmp_path, reader):
+    path = tmp_path / "diary.xlsx"
+    _write_sheet(path, [
+        ["time", "value"],
+        ["2024-03-29 10:00:00", 1],
+        ["2024-03-30 10:00:00", 2],
+        ["NA", "n/a"],
+    ])
+    if reader == "calamine":
+        pytest.importorskip("python_calamine")
+        xl = pd.ExcelFile(path, engine="calamine")
+    else:
+        xl = openpyxl.load_workbook(path, read_only=True, data_only=True)
+
+    has_data, row = _sheet_tail(xl, "TET")
+
+    assert has_data
+    assert list(row)[:2] == ["2024-03-29 10:00:00", 1]
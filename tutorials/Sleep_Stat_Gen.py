@@ -15,12 +15,12 @@ print(chan)
 
 #downsample from 250Hz to 100Hz to speed up calculation
 print(raw.info['sfreq'])
-raw.resample(100)
+raw.resample(100, n_jobs=-1)
 sf = raw.info['sfreq']
 sf
 
 #bandpass filter to get rid of line frequency. Also there isn't much useful information beyond this frequency
-raw.filter(0.3, 45)
+raw.filter(0.3, 45, n_jobs=-1, method="fir", fir_design="firwin", phase="zero", verbose=False)
 
 #optional - just to see data shape
 data = raw.get_data(units="uV")
@@ -40,10 +40,6 @@ sleep_stat = yasa.sleep_statistics(hypno, sf_hyp=1/30)
 sleep_stat
 
 #send the sleep statistics to an output file of choice in csv format. This will be used by the next code blocks in matlab for analyses
-import csv
-with open(r"C:\Users\Ananya Rao\Documents\project_files\09_12\sleep_stats.csv", 'w') as csv_file:  
-    writer = csv.writer(csv_file)
-    for key, value in sleep_stat.items():
-        writer.writerow([key, value])     
-        
+pd.Series(sleep_stat).to_csv(r"C:\Users\Ananya Rao\Documents\project_files\09_12\sleep_stats.csv", header=False)
+
 #After this, go back to matlab and continue from where you left off        